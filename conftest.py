@@ -0,0 +1,5 @@
+"""Pytest configuration: make the project root importable as `src` / `scripts`."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -14,8 +14,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from loguru import logger
 from src.config import settings
 from src.utils.storage import (
+    DIR_CACHE_NAME,
     get_storage_path,
-    move_to_nas,
+    move_batch_to_nas,
     cleanup_old_data,
     get_storage_stats,
     check_available_space,
@@ -84,28 +85,31 @@ def cleanup_local_storage(dry_run: bool = False) -> Dict[str, Any]:
             logger.warning(f"Local storage path does not exist: {local_base}")
             return result
 
-        # Find files older than threshold
+        # Find files older than threshold (the storage scan cache stays local)
         old_files = []
+        file_sizes = []
         for file_path in local_base.rglob('*'):
-            if file_path.is_file():
+            if file_path.is_file() and not file_path.name.startswith(DIR_CACHE_NAME):
                 result['files_scanned'] += 1
-                file_mtime = file_path.stat().st_mtime
+                file_stat = file_path.stat()
 
-                if file_mtime < cutoff_timestamp:
+                if file_stat.st_mtime < cutoff_timestamp:
                     old_files.append(file_path)
+                    file_sizes.append(file_stat.st_size)
 
         logger.info(f"Found {len(old_files)} files older than 7 days")
 
         # Move files to NAS
-        for file_path in old_files:
-            file_size = file_path.stat().st_size
 
-            if dry_run:
+        if dry_run:
+            for file_path, file_size in zip(old_files, file_sizes):
                 logger.info(f"[DRY RUN] Would move: {file_path}")
                 result['files_moved'] += 1
                 result['space_freed_gb'] += file_size / (1024 ** 3)
-            else:
-                if move_to_nas(str(file_path), delete_local=True):
+        else:
+            moved = move_batch_to_nas(old_files, delete_local=True)
+            for file_size, ok in zip(file_sizes, moved):
+                if ok:
                     result['files_moved'] += 1
                     result['space_freed_gb'] += file_size / (1024 ** 3)
                 else:
@@ -469,7 +473,7 @@ def generate_storage_report() -> str:
 
         # Collect data
         stats = get_storage_stats()
-        recommendations = recommend_cleanup()
+        recommendations = list(recommend_cleanup())
 
         # Build report
         report_lines = []
@@ -595,7 +599,8 @@ def emergency_cleanup(target_gb: float, dry_run: bool = False) -> Dict[str, Any]
             files = []
             for f in local_raw.rglob('*'):
                 if f.is_file():
-                    files.append((f, f.stat().st_mtime, f.stat().st_size))
+                    file_stat = f.stat()
+                    files.append((f, file_stat.st_mtime, file_stat.st_size))
 
             files.sort(key=lambda x: x[1])  # Sort by mtime
 
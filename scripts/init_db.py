@@ -84,6 +84,15 @@ def init_database():
         """)
         logger.info("✓ Created asset_thresholds table")
         
+        # Create backup_state table (incremental cloud backup progress)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS backup_state (
+            name TEXT PRIMARY KEY,
+            last_run TIMESTAMPTZ NOT NULL
+        );
+        """)
+        logger.info("✓ Created backup_state table")
+        
         # Create hypertables for TimescaleDB
         try:
             cur.execute("SELECT create_hypertable('model_forecasts', 'valid_time', if_not_exists => TRUE);")
@@ -109,6 +118,15 @@ def init_database():
         cur.execute("CREATE INDEX IF NOT EXISTS idx_obs_station_time ON observations(station_id, obs_time);")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_obs_location ON observations(location_lat, location_lon);")
         cur.execute("CREATE INDEX IF NOT EXISTS idx_verification_model ON verification_scores(model_name, variable, valid_time);")
+        # Covering indexes for the verification queries (index-only scans)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_forecasts_model_var_time ON model_forecasts(model_name, variable, valid_time)
+            INCLUDE (id, value, location_lat, location_lon, init_time, lead_time_hours);
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_obs_time_var ON observations(obs_time, variable)
+            INCLUDE (id, station_id, location_lat, location_lon, value, units, obs_type);
+        """)
         logger.info("✓ Created indexes")
         
         # Insert sample asset thresholds
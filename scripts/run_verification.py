@@ -35,6 +35,9 @@ Examples:
   # Dry run to see what would be verified
   python scripts/run_verification.py --model GFS --hours-back 6 --dry-run
 
+  # Compute the summary inside PostgreSQL (nothing is stored)
+  python scripts/run_verification.py --model GFS --hours-back 24 --in-database
+
 Decision Metrics Guide:
   CSI (Critical Success Index): 0-1, higher is better (0.7 = excellent)
   Hit Rate (POD): Probability of detection (want HIGH for safety)
@@ -58,9 +61,15 @@ Decision Metrics Guide:
                        help='Show what would be verified without storing results')
     parser.add_argument('--skill-summary', action='store_true',
                        help='Display 7-day skill summary from database')
+    parser.add_argument('--in-database', action='store_true',
+                       help='Compute the summary in PostgreSQL without storing results (requires PostGIS)')
 
     args = parser.parse_args()
 
+    # Log through a background queue so sink writes never stall verification
+    logger.remove()
+    logger.add(sys.stderr, enqueue=True)
+
     logger.info("=" * 70)
     logger.info("FORECAST VERIFICATION")
     logger.info("=" * 70)
@@ -73,6 +82,8 @@ Decision Metrics Guide:
     logger.info(f"Period: {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')} UTC")
     logger.info(f"Variable: {args.variable or 'all'}")
     logger.info(f"Spatial threshold: {args.spatial_threshold} km")
+    if args.in_database:
+        args.dry_run = True
     if args.dry_run:
         logger.warning("DRY RUN - Results will not be stored")
 
@@ -82,13 +93,21 @@ Decision Metrics Guide:
         temporal_threshold_hours=args.temporal_threshold
     )
 
-    results = verifier.verify_forecasts(
-        model_name=args.model,
-        start_time=start_time,
-        end_time=end_time,
-        variable=args.variable,
-        dry_run=args.dry_run
-    )
+    if args.in_database:
+        results = verifier.verify_in_database(
+            model_name=args.model,
+            start_time=start_time,
+            end_time=end_time,
+            variable=args.variable
+        )
+    else:
+        results = verifier.verify_forecasts(
+            model_name=args.model,
+            start_time=start_time,
+            end_time=end_time,
+            variable=args.variable,
+            dry_run=args.dry_run
+        )
 
     # Display results
     print("\n" + "=" * 70)
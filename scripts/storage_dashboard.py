@@ -302,9 +302,9 @@ def get_backup_status() -> Dict[str, Any]:
         if nas_backup_dir.exists():
             backups = list(nas_backup_dir.glob('pgdump_*.sql.gz'))
             if backups:
-                latest = max(backups, key=lambda p: p.stat().st_mtime)
-                mtime = datetime.fromtimestamp(latest.stat().st_mtime)
-                size = latest.stat().st_size
+                latest_stat = max((p.stat() for p in backups), key=lambda st: st.st_mtime)
+                mtime = datetime.fromtimestamp(latest_stat.st_mtime)
+                size = latest_stat.st_size
 
                 # Check if backup is recent (within 36 hours)
                 age_hours = (datetime.now() - mtime).total_seconds() / 3600
@@ -320,7 +320,7 @@ def get_backup_status() -> Dict[str, Any]:
         # Check for cloud backups
         last_cloud_backup = get_last_backup_time()
         if last_cloud_backup:
-            age_hours = (datetime.now() - last_cloud_backup).total_seconds() / 3600
+            age_hours = (datetime.now(last_cloud_backup.tzinfo) - last_cloud_backup).total_seconds() / 3600
             health = 'good' if age_hours < 168 else 'warning'  # 7 days
 
             status['cloud_backup'] = {
@@ -0,0 +1,21 @@
+-- Backup bookkeeping schema for cloud backups
+-- Tracks backup progress in the database so incremental backups are consistent across hosts
+
+-- Last successful run per backup (e.g. 'verification_scores')
+CREATE TABLE IF NOT EXISTS backup_state (
+    name TEXT PRIMARY KEY,
+    last_run TIMESTAMPTZ NOT NULL
+);
+
+COMMENT ON TABLE backup_state IS 'Last successful run time per cloud backup, used for incremental exports';
+COMMENT ON COLUMN backup_state.last_run IS 'Start time of the transaction that exported the last backup';
+
+-- BRIN indexes for the backup export filters (created_at for incremental
+-- backups, valid_time for date-range backups). Rows arrive in time order, so
+-- BRIN stays a few KB while turning the export into a scan of new ranges only.
+-- Not CONCURRENTLY: verification_scores is a TimescaleDB hypertable, which does
+-- not support concurrent index builds.
+CREATE INDEX IF NOT EXISTS verification_scores_created_at_brin
+    ON verification_scores USING BRIN (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS verification_scores_valid_time_brin
+    ON verification_scores USING BRIN (valid_time) WITH (pages_per_range = 32);
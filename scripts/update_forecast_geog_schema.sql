@@ -0,0 +1,15 @@
+-- Spatial index on forecast locations for server-side nearest-neighbour matching
+-- Lets ForecastVerifier.find_nearest_forecast use the PostGIS <-> KNN operator
+
+CREATE EXTENSION IF NOT EXISTS postgis;
+
+-- Generated from location_lat/location_lon so existing inserts need no changes
+ALTER TABLE model_forecasts
+    ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+    GENERATED ALWAYS AS (
+        ST_SetSRID(ST_MakePoint(location_lon, location_lat), 4326)::geography
+    ) STORED;
+
+COMMENT ON COLUMN model_forecasts.geog IS 'Forecast point location, derived from location_lon/location_lat';
+
+CREATE INDEX IF NOT EXISTS idx_forecasts_geog ON model_forecasts USING GIST (geog);
@@ -0,0 +1,14 @@
+-- Covering indexes for the verification queries
+-- ForecastVerifier filters forecasts by (model_name, variable, valid_time range)
+-- and observations by (obs_time range, variable); INCLUDE carries the selected
+-- columns so both become index-only scans. Check with EXPLAIN (ANALYZE, BUFFERS).
+-- Not CONCURRENTLY: both tables are TimescaleDB hypertables, which do not
+-- support concurrent index builds.
+
+CREATE INDEX IF NOT EXISTS idx_forecasts_model_var_time
+    ON model_forecasts (model_name, variable, valid_time)
+    INCLUDE (id, value, location_lat, location_lon, init_time, lead_time_hours);
+
+CREATE INDEX IF NOT EXISTS idx_obs_time_var
+    ON observations (obs_time, variable)
+    INCLUDE (id, station_id, location_lat, location_lon, value, units, obs_type);
@@ -64,4 +64,16 @@ CREATE INDEX IF NOT EXISTS idx_skill_model_var ON skill_metrics_summary(model_na
 CREATE INDEX IF NOT EXISTS idx_skill_threshold ON skill_metrics_summary(threshold_value);
 CREATE INDEX IF NOT EXISTS idx_skill_date ON skill_metrics_summary(verification_date);
 
+-- One row per GROUP BY key; required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_skill_unique ON skill_metrics_summary(
+    model_name, variable, lead_time_hours, threshold_value, verification_date
+);
+
+-- Last refresh per materialized view, so concurrent workers refresh at most
+-- once per interval
+CREATE TABLE IF NOT EXISTS refresh_log (
+    view_name TEXT PRIMARY KEY,
+    last_refresh TIMESTAMPTZ NOT NULL
+);
+
 COMMENT ON MATERIALIZED VIEW skill_metrics_summary IS 'Aggregated skill metrics for model selection - refresh after batch verification runs';
@@ -1,21 +1,45 @@
 """Cloud backup system for weather model verification metrics."""
+import base64
 import gzip
+import hashlib
+import io
 import json
 import os
+import shutil
 import time
 import subprocess
-from datetime import datetime, timedelta
+import tempfile
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple, BinaryIO
 from loguru import logger
 
 from src.config import settings
 from src.utils.database import get_db_connection
 
 
-# Last backup tracking file
-LAST_BACKUP_FILE = Path("data/.last_backup")
+# Block size for streaming file compression
+COPY_BUFFER_SIZE = 1 << 20
+
+# Azure blobs smaller than this are uploaded without parallel block staging
+AZURE_SINGLE_UPLOAD_SIZE = 8 * 1024 * 1024
+
+# Rows per Parquet row group; streamed exports fetch one row group per round trip
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+EXPORT_BATCH_SIZE = PARQUET_ROW_GROUP_SIZE
+
+# Parquet writer settings for exports. model_name/variable are low-cardinality
+# and dictionary-encode well, lead times are small sorted-ish integers, and
+# row-group statistics let filtered restores skip irrelevant chunks.
+PARQUET_WRITE_OPTIONS = {
+    'compression': 'zstd',
+    'compression_level': 3,
+    'use_dictionary': ['model_name', 'variable'],
+    'column_encoding': {'lead_time_hours': 'DELTA_BINARY_PACKED'},
+    'write_statistics': True,
+    'data_page_version': '2.0',
+}
 
 
 class CloudBackupError(Exception):
@@ -23,10 +47,14 @@ class CloudBackupError(Exception):
     pass
 
 
+@lru_cache(maxsize=1)
 def get_cloud_client():
     """
     Get cloud storage client based on configured provider.
 
+    The client is created once per process and reused, so uploads,
+    downloads and listings share one connection pool and credential chain.
+
     Returns:
         Configured cloud client (boto3 S3 client or Azure BlobServiceClient)
 
@@ -41,13 +69,17 @@ def get_cloud_client():
     elif provider == 'aws':
         try:
             import boto3
-            from botocore.exceptions import ClientError
+            from botocore.config import Config
 
             client = boto3.client(
                 's3',
                 aws_access_key_id=settings.aws_access_key_id,
                 aws_secret_access_key=settings.aws_secret_access_key,
-                region_name=settings.aws_region
+                region_name=settings.aws_region,
+                config=Config(
+                    max_pool_connections=32,
+                    retries={'mode': 'standard', 'max_attempts': 5}
+                )
             )
             logger.debug("AWS S3 client initialized")
             return client, 'aws'
@@ -80,10 +112,47 @@ def get_cloud_client():
         raise CloudBackupError(f"Unsupported cloud provider: {provider}")
 
 
+def _gzip_module():
+    """Return isal's SIMD-accelerated igzip if installed, else the stdlib gzip module."""
+    try:
+        from isal import igzip
+        return igzip
+    except ImportError:
+        return gzip
+
+
+def gzip_compress_file(source: Path, destination: Path) -> None:
+    """
+    Gzip-compress a file in COPY_BUFFER_SIZE blocks.
+
+    Uses isal (level 3, its highest) when available, otherwise stdlib
+    gzip at level 6.
+    """
+    gzip_impl = _gzip_module()
+    compresslevel = 3 if gzip_impl is not gzip else 6
+
+    with open(source, 'rb') as f_in:
+        with gzip_impl.open(destination, 'wb', compresslevel=compresslevel) as f_out:
+            shutil.copyfileobj(f_in, f_out, COPY_BUFFER_SIZE)
+
+
+def gzip_decompress_file(source: Path, destination: Path) -> None:
+    """Decompress a gzip file in COPY_BUFFER_SIZE blocks."""
+    with _gzip_module().open(source, 'rb') as f_in:
+        with open(destination, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out, COPY_BUFFER_SIZE)
+
+
 def upload_to_cloud(local_file: Path, cloud_key: str, dry_run: bool = False) -> bool:
     """
     Upload a file to cloud storage.
 
+    The file is read once, and checksums for server-side integrity checking
+    come from that same read: small S3 objects are hashed in memory
+    (SHA-256, also stored in the 'sha256' metadata field), larger ones use
+    boto3's per-part SHA-256 (ChecksumAlgorithm), and Azure validates a
+    transactional MD5 of each request as it is sent (validate_content).
+
     Args:
         local_file: Path to local file
         cloud_key: Key/path in cloud storage
@@ -98,36 +167,54 @@ def upload_to_cloud(local_file: Path, cloud_key: str, dry_run: bool = False) ->
 
     try:
         client, provider = get_cloud_client()
-        file_size = local_file.stat().st_size
-        file_size_mb = file_size / (1024 * 1024)
-
-        logger.info(f"Uploading {local_file.name} ({file_size_mb:.2f} MB) to {provider}...")
-
-        if provider == 'aws':
-            client.upload_file(
-                str(local_file),
-                settings.s3_bucket_name,
-                cloud_key,
-                ExtraArgs={
-                    'Metadata': {
-                        'upload_timestamp': datetime.now().isoformat(),
-                        'original_size': str(file_size)
-                    }
-                }
-            )
 
-        elif provider == 'azure':
-            container_client = client.get_container_client(settings.azure_container_name)
-            blob_client = container_client.get_blob_client(cloud_key)
-
-            with open(local_file, 'rb') as data:
+        with open(local_file, 'rb') as data:
+            file_size = os.fstat(data.fileno()).st_size
+            file_size_mb = file_size / (1024 * 1024)
+
+            logger.info(f"Uploading {local_file.name} ({file_size_mb:.2f} MB) to {provider}...")
+
+            metadata = {
+                'upload_timestamp': datetime.now().isoformat(),
+                'original_size': str(file_size)
+            }
+
+            if provider == 'aws':
+                if file_size < settings.multipart_threshold:
+                    # Small files: a single PUT avoids the multipart round trips,
+                    # and the checksum comes from the same in-memory read
+                    body = data.read()
+                    digest = hashlib.sha256(body).digest()
+                    metadata['sha256'] = digest.hex()
+
+                    client.put_object(
+                        Bucket=settings.s3_bucket_name,
+                        Key=cloud_key,
+                        Body=body,
+                        Metadata=metadata,
+                        ChecksumSHA256=base64.b64encode(digest).decode()
+                    )
+                else:
+                    from boto3.s3.transfer import TransferConfig
+
+                    # boto3 checksums each part as it is uploaded
+                    client.upload_file(
+                        str(local_file),
+                        settings.s3_bucket_name,
+                        cloud_key,
+                        ExtraArgs={'Metadata': metadata, 'ChecksumAlgorithm': 'SHA256'},
+                        Config=TransferConfig(multipart_threshold=settings.multipart_threshold)
+                    )
+
+            elif provider == 'azure':
+                container_client = client.get_container_client(settings.azure_container_name)
+                blob_client = container_client.get_blob_client(cloud_key)
                 blob_client.upload_blob(
                     data,
                     overwrite=True,
-                    metadata={
-                        'upload_timestamp': datetime.now().isoformat(),
-                        'original_size': str(file_size)
-                    }
+                    metadata=metadata,
+                    validate_content=True,
+                    max_concurrency=1 if file_size < AZURE_SINGLE_UPLOAD_SIZE else 8
                 )
 
         logger.success(f"Successfully uploaded {cloud_key}")
@@ -186,32 +273,225 @@ def download_from_cloud(cloud_key: str, local_file: Path) -> bool:
         return False
 
 
-def get_last_backup_time() -> Optional[datetime]:
+def download_fileobj_from_cloud(cloud_key: str, fileobj: BinaryIO) -> bool:
+    """
+    Download a file from cloud storage into a writable binary file object.
+
+    Args:
+        cloud_key: Key/path in cloud storage
+        fileobj: Binary file object (e.g. io.BytesIO) to write into
+
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        client, provider = get_cloud_client()
+
+        logger.info(f"Downloading {cloud_key} from {provider}...")
+
+        if provider == 'aws':
+            client.download_fileobj(settings.s3_bucket_name, cloud_key, fileobj)
+
+        elif provider == 'azure':
+            container_client = client.get_container_client(settings.azure_container_name)
+            blob_client = container_client.get_blob_client(cloud_key)
+            blob_client.download_blob().readinto(fileobj)
+
+        fileobj.seek(0)
+        logger.success(f"Successfully downloaded {cloud_key}")
+        return True
+
+    except CloudBackupError as e:
+        logger.warning(str(e))
+        return False
+    except Exception as e:
+        logger.error(f"Failed to download {cloud_key}: {e}")
+        return False
+
+
+def get_last_backup_time(name: str = 'verification_scores') -> Optional[datetime]:
     """
     Get the timestamp of the last successful backup.
 
+    Backup progress lives in the backup_state table (see
+    scripts/update_backup_schema.sql) so every host sees the same value.
+
+    Args:
+        name: Backup name to look up
+
     Returns:
         Datetime of last backup, or None if never backed up
     """
-    if not LAST_BACKUP_FILE.exists():
-        return None
-
     try:
-        timestamp_str = LAST_BACKUP_FILE.read_text().strip()
-        return datetime.fromisoformat(timestamp_str)
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT last_run FROM backup_state WHERE name = %s", (name,))
+                row = cur.fetchone()
+                return row[0] if row else None
     except Exception as e:
         logger.warning(f"Failed to read last backup time: {e}")
         return None
 
 
-def update_last_backup_time():
-    """Update the last backup timestamp to now."""
+def update_last_backup_time(conn, last_run: datetime, name: str = 'verification_scores'):
+    """
+    Record the last backup time.
+
+    last_run should be a database time taken before the export's snapshot
+    (see backup_verification_scores), so rows created while the backup was
+    compressed and uploaded are picked up by the next incremental run.
+
+    Args:
+        conn: Open database connection; the update commits with its transaction
+        last_run: Time up to which rows have been exported
+        name: Backup name to update
+    """
+    with conn.cursor() as cur:
+        # Databases set up before backup_state existed get it on first use
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS backup_state (
+                name TEXT PRIMARY KEY,
+                last_run TIMESTAMPTZ NOT NULL
+            )
+        """)
+        cur.execute("""
+            INSERT INTO backup_state (name, last_run)
+            VALUES (%s, %s)
+            ON CONFLICT (name) DO UPDATE SET last_run = EXCLUDED.last_run
+        """, (name, last_run))
+    logger.debug("Updated last backup timestamp")
+
+
+def fetch_query_arrow(query: str, params: Optional[Tuple], conn):
+    """
+    Run a query and return the full result as a pyarrow Table.
+
+    Uses connectorx when it is installed, so the result is built column-wise
+    straight from the Postgres wire format; otherwise the rows are fetched
+    with a regular cursor and converted once. Intended for small to medium
+    results (aggregates) - large exports should use export_query_to_parquet.
+
+    Args:
+        query: SQL query with %s placeholders
+        params: Query parameters (or None)
+        conn: Open connection (used for quoting, and for the fetch fallback)
+
+    Returns:
+        pyarrow.Table with one column per result column
+    """
+    import pyarrow as pa
+
     try:
-        LAST_BACKUP_FILE.parent.mkdir(parents=True, exist_ok=True)
-        LAST_BACKUP_FILE.write_text(datetime.now().isoformat())
-        logger.debug("Updated last backup timestamp")
-    except Exception as e:
-        logger.error(f"Failed to update last backup time: {e}")
+        import connectorx as cx
+    except ImportError:
+        cx = None
+
+    if cx is not None:
+        # connectorx has no parameter binding, so let psycopg2 quote the values
+        with conn.cursor() as cur:
+            sql = cur.mogrify(query, params).decode()
+        return cx.read_sql(settings.database_url, sql, return_type='arrow')
+
+    with conn.cursor() as cur:
+        cur.execute(query, params)
+        columns = [desc[0] for desc in cur.description]
+        rows = cur.fetchall()
+
+    return pa.Table.from_pydict({
+        name: [row[i] for row in rows] for i, name in enumerate(columns)
+    })
+
+
+def _arrow_schema(description, first_batch):
+    """
+    Arrow schema for a query result, from the cursor's Postgres type codes.
+
+    Columns of unmapped types take the type Arrow infers from the first
+    batch (string if that batch is all NULL), so a column that is NULL in
+    early rows is not pinned to Arrow's null type.
+    """
+    import pyarrow as pa
+
+    pg_types = {
+        16: pa.bool_(),                       # boolean
+        20: pa.int64(),                       # bigint
+        21: pa.int16(),                       # smallint
+        23: pa.int32(),                       # integer
+        700: pa.float32(),                    # real
+        701: pa.float64(),                    # double precision
+        25: pa.string(),                      # text
+        1042: pa.string(),                    # char(n)
+        1043: pa.string(),                    # varchar
+        1082: pa.date32(),                    # date
+        1114: pa.timestamp('us'),             # timestamp
+        1184: pa.timestamp('us', tz='UTC'),   # timestamptz
+    }
+
+    fields = []
+    for i, column in enumerate(description):
+        arrow_type = pg_types.get(column.type_code)
+        if arrow_type is None:
+            arrow_type = pa.array([row[i] for row in first_batch]).type
+            if pa.types.is_null(arrow_type):
+                arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type))
+
+    return pa.schema(fields)
+
+
+def export_query_to_parquet(query: str, params: Optional[Tuple], parquet_file: Path,
+                            conn=None) -> int:
+    """
+    Export the results of a query to a Parquet file.
+
+    Rows are read through a server-side (named) cursor on conn in batches
+    of EXPORT_BATCH_SIZE and appended to the Parquet file one batch (one row
+    group) at a time, so memory use stays bounded regardless of the result
+    size and the export runs in the caller's transaction. (connectorx, used
+    by fetch_query_arrow for bounded aggregate queries, is deliberately not
+    used here: it materializes the whole result on its own connection.)
+
+    Args:
+        query: SQL query with %s placeholders
+        params: Query parameters (or None)
+        parquet_file: Destination Parquet file
+        conn: Open connection to run the export in (a new one is opened if None)
+
+    Returns:
+        Number of rows written (the file is only created if rows were found)
+    """
+    if conn is None:
+        with get_db_connection() as conn:
+            return export_query_to_parquet(query, params, parquet_file, conn=conn)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows_written = 0
+    writer = None
+
+    try:
+        with conn.cursor(name='verif_cur') as cur:
+            cur.itersize = EXPORT_BATCH_SIZE
+            cur.execute(query, params)
+
+            for batch in iter(lambda: cur.fetchmany(EXPORT_BATCH_SIZE), []):
+                if writer is None:
+                    # Named cursors only describe columns after the first fetch
+                    schema = _arrow_schema(cur.description, batch)
+                    writer = pq.ParquetWriter(parquet_file, schema, **PARQUET_WRITE_OPTIONS)
+
+                table = pa.Table.from_pydict({
+                    field.name: [row[i] for row in batch] for i, field in enumerate(schema)
+                }, schema=schema)
+
+                writer.write_table(table)
+                rows_written += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows_written
 
 
 def backup_verification_scores(date_range: Optional[str] = None, dry_run: bool = False) -> Dict[str, Any]:
@@ -240,83 +520,96 @@ def backup_verification_scores(date_range: Optional[str] = None, dry_run: bool =
     try:
         # Build query
         if date_range:
-            # Specific date range
+            # Specific date range, bounded in UTC rather than the session timezone
             start_date, end_date = date_range.split(':')
-            query = f"""
+            query = """
                 SELECT * FROM verification_scores
-                WHERE valid_time >= '{start_date}'
-                  AND valid_time <= '{end_date}'
+                WHERE valid_time >= %s
+                  AND valid_time <= %s
                 ORDER BY valid_time
             """
+            params = parse_date_range(date_range)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"verification_{start_date}_to_{end_date}_{timestamp}"
         else:
             # Incremental: get records since last backup
             last_backup = get_last_backup_time()
             if last_backup:
-                query = f"""
+                query = """
                     SELECT * FROM verification_scores
-                    WHERE created_at > '{last_backup.isoformat()}'
+                    WHERE created_at > %s
                     ORDER BY created_at
                 """
+                params = (last_backup,)
                 logger.info(f"Incremental backup since {last_backup}")
             else:
                 # First backup - get everything
                 query = "SELECT * FROM verification_scores ORDER BY created_at"
+                params = None
                 logger.info("First backup - exporting all records")
 
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"verification_{timestamp}"
 
-        # Export to pandas DataFrame
-        logger.info("Querying verification scores...")
-        with get_db_connection() as conn:
-            df = pd.read_sql_query(query, conn)
-
-        result['records_exported'] = len(df)
-
-        if result['records_exported'] == 0:
-            logger.info("No new records to backup")
-            result['success'] = True
-            result['duration_seconds'] = time.time() - start_time
-            return result
-
-        # Save to Parquet
         temp_dir = Path("data/temp")
         temp_dir.mkdir(parents=True, exist_ok=True)
-
         parquet_file = temp_dir / f"{filename}.parquet"
-        logger.info(f"Writing {result['records_exported']} records to Parquet...")
-        df.to_parquet(parquet_file, compression='gzip', index=False)
-
-        # Compress with gzip (level 6)
         compressed_file = temp_dir / f"{filename}.parquet.gz"
-        logger.info("Compressing with gzip...")
-
-        with open(parquet_file, 'rb') as f_in:
-            with gzip.open(compressed_file, 'wb', compresslevel=6) as f_out:
-                f_out.writelines(f_in)
 
-        result['size_bytes'] = compressed_file.stat().st_size
-        size_mb = result['size_bytes'] / (1024 * 1024)
-        logger.info(f"Compressed size: {size_mb:.2f} MB")
-
-        # Estimate cost (S3 Standard: $0.023/GB/month)
-        size_gb = result['size_bytes'] / (1024 ** 3)
-        monthly_cost = size_gb * 0.023
-        logger.info(f"Estimated monthly storage cost: ${monthly_cost:.4f}")
-
-        # Upload to cloud
-        cloud_key = f"verification_scores/{filename}.parquet.gz"
-        success = upload_to_cloud(compressed_file, cloud_key, dry_run)
+        # The recorded backup time is read before the export streams its rows
+        # on this connection, so it precedes the export's snapshot, and it is
+        # only committed once the upload has succeeded
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT now()")
+                export_started = cur.fetchone()[0]
 
-        if success:
-            result['success'] = True
-            if not dry_run:
-                update_last_backup_time()
-            logger.success(f"Backup completed: {result['records_exported']} records")
-        else:
-            logger.error("Backup failed during upload")
+            logger.info("Querying verification scores...")
+            result['records_exported'] = export_query_to_parquet(
+                query, params, parquet_file, conn=conn
+            )
+            # Don't sit idle in a transaction through compression and upload
+            conn.commit()
+
+            if result['records_exported'] == 0:
+                logger.info("No new records to backup")
+                parquet_file.unlink(missing_ok=True)
+                result['success'] = True
+                result['duration_seconds'] = time.time() - start_time
+                return result
+
+            logger.info(f"Wrote {result['records_exported']} records to Parquet")
+
+            # Compress with gzip
+            logger.info("Compressing with gzip...")
+            gzip_compress_file(parquet_file, compressed_file)
+
+            result['size_bytes'] = compressed_file.stat().st_size
+            size_mb = result['size_bytes'] / (1024 * 1024)
+            logger.info(f"Compressed size: {size_mb:.2f} MB")
+
+            # Estimate cost (S3 Standard: $0.023/GB/month)
+            size_gb = result['size_bytes'] / (1024 ** 3)
+            monthly_cost = size_gb * 0.023
+            logger.info(f"Estimated monthly storage cost: ${monthly_cost:.4f}")
+
+            # Upload to cloud
+            cloud_key = f"verification_scores/{filename}.parquet.gz"
+            success = upload_to_cloud(compressed_file, cloud_key, dry_run)
+
+            if success:
+                result['success'] = True
+                if not dry_run:
+                    # The upload already succeeded; failing to record it only
+                    # means the next incremental run exports these rows again
+                    try:
+                        update_last_backup_time(conn, export_started)
+                    except Exception as e:
+                        conn.rollback()
+                        logger.error(f"Failed to record last backup time: {e}")
+                logger.success(f"Backup completed: {result['records_exported']} records")
+            else:
+                logger.error("Backup failed during upload")
 
         # Cleanup temporary files
         parquet_file.unlink(missing_ok=True)
@@ -368,9 +661,9 @@ def backup_conditional_skill_db(dry_run: bool = False) -> Dict[str, Any]:
 
         logger.info("Querying conditional skill metrics...")
         with get_db_connection() as conn:
-            df = pd.read_sql_query(query, conn)
+            table = fetch_query_arrow(query, None, conn)
 
-        result['records_exported'] = len(df)
+        result['records_exported'] = table.num_rows
 
         if result['records_exported'] == 0:
             logger.warning("No skill metrics found")
@@ -381,7 +674,7 @@ def backup_conditional_skill_db(dry_run: bool = False) -> Dict[str, Any]:
         skill_data = {
             'export_timestamp': datetime.now().isoformat(),
             'record_count': result['records_exported'],
-            'metrics': df.to_dict(orient='records')
+            'metrics': table.to_pylist()
         }
 
         # Save to JSON file
@@ -397,9 +690,7 @@ def backup_conditional_skill_db(dry_run: bool = False) -> Dict[str, Any]:
 
         # Compress with gzip
         compressed_file = temp_dir / f"skill_metrics_{timestamp}.json.gz"
-        with open(json_file, 'rb') as f_in:
-            with gzip.open(compressed_file, 'wb', compresslevel=6) as f_out:
-                f_out.writelines(f_in)
+        gzip_compress_file(json_file, compressed_file)
 
         result['size_bytes'] = compressed_file.stat().st_size
         logger.info(f"Compressed size: {result['size_bytes'] / 1024:.2f} KB")
@@ -452,7 +743,6 @@ def backup_database_dump(backup_type: str = 'full', dry_run: bool = False) -> Di
 
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         dump_file = temp_dir / f"database_dump_{timestamp}.sql"
-        compressed_file = temp_dir / f"database_dump_{timestamp}.sql.gz"
 
         # Parse database URL
         db_url = settings.database_url
@@ -460,39 +750,69 @@ def backup_database_dump(backup_type: str = 'full', dry_run: bool = False) -> Di
 
         logger.info(f"Creating {backup_type} database dump...")
 
-        # Use pg_dump command
-        dump_command = [
-            'pg_dump',
-            db_url,
-            '-f', str(dump_file),
-            '--no-owner',
-            '--no-acl'
-        ]
+        if shutil.which('zstd'):
+            # Pipe pg_dump straight into multithreaded zstd; the uncompressed
+            # dump never touches disk
+            compressed_file = temp_dir / f"database_dump_{timestamp}.sql.zst"
 
-        # Execute pg_dump
-        process = subprocess.run(
-            dump_command,
-            capture_output=True,
-            text=True
-        )
+            with tempfile.TemporaryFile() as dump_stderr:
+                dump_process = subprocess.Popen(
+                    ['pg_dump', db_url, '--no-owner', '--no-acl'],
+                    stdout=subprocess.PIPE,
+                    stderr=dump_stderr
+                )
+                zstd_process = subprocess.Popen(
+                    ['zstd', '-T0', '-3', '--long=27', '-q', '-f', '-o', str(compressed_file)],
+                    stdin=dump_process.stdout,
+                    stderr=subprocess.PIPE
+                )
+                dump_process.stdout.close()
+                _, zstd_error = zstd_process.communicate()
+                dump_process.wait()
 
-        if process.returncode != 0:
-            raise Exception(f"pg_dump failed: {process.stderr}")
+                if dump_process.returncode != 0:
+                    dump_stderr.seek(0)
+                    raise Exception(f"pg_dump failed: {dump_stderr.read().decode(errors='replace')}")
 
-        logger.success("Database dump created")
+            if zstd_process.returncode != 0:
+                raise Exception(f"zstd failed: {zstd_error.decode(errors='replace')}")
 
-        # Compress with gzip
-        logger.info("Compressing database dump...")
-        with open(dump_file, 'rb') as f_in:
-            with gzip.open(compressed_file, 'wb', compresslevel=6) as f_out:
-                f_out.writelines(f_in)
+            logger.success("Database dump created and compressed with zstd")
+
+        else:
+            compressed_file = temp_dir / f"database_dump_{timestamp}.sql.gz"
+
+            # Use pg_dump command
+            dump_command = [
+                'pg_dump',
+                db_url,
+                '-f', str(dump_file),
+                '--no-owner',
+                '--no-acl'
+            ]
+
+            # Execute pg_dump
+            process = subprocess.run(
+                dump_command,
+                capture_output=True,
+                text=True
+            )
+
+            if process.returncode != 0:
+                raise Exception(f"pg_dump failed: {process.stderr}")
+
+            logger.success("Database dump created")
+
+            # Compress with gzip
+            logger.info("Compressing database dump (zstd not found, using gzip)...")
+            gzip_compress_file(dump_file, compressed_file)
 
         result['size_bytes'] = compressed_file.stat().st_size
         size_mb = result['size_bytes'] / (1024 * 1024)
         logger.info(f"Compressed dump size: {size_mb:.2f} MB")
 
         # Upload to cloud
-        cloud_key = f"database_dumps/database_{timestamp}.sql.gz"
+        cloud_key = f"database_dumps/database_{timestamp}{''.join(compressed_file.suffixes)}"
         success = upload_to_cloud(compressed_file, cloud_key, dry_run)
 
         if success:
@@ -513,16 +833,63 @@ def backup_database_dump(backup_type: str = 'full', dry_run: bool = False) -> Di
     return result
 
 
+def parse_date_range(date_range: str) -> Tuple[datetime, datetime]:
+    """
+    Parse a 'YYYY-MM-DD:YYYY-MM-DD' range into UTC datetimes.
+
+    Bounds are midnight UTC. backup_verification_scores and
+    restore_verification_scores both filter valid_time with these values,
+    so a range means the same rows whatever the session timezone.
+    """
+    start_date, end_date = date_range.split(':')
+    start = datetime.strptime(start_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    end = datetime.strptime(end_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+    return start, end
+
+
+def _backup_may_overlap(backup: Dict[str, Any], start: datetime, end: datetime) -> bool:
+    """
+    Whether a verification backup can hold rows with valid_time in [start, end].
+
+    Range backups carry their own bounds in the filename. Incremental backups
+    hold rows verified before they were uploaded, and a row is only verified
+    once its observation exists, so one uploaded before start has nothing in
+    the range. Backups that match neither rule are assumed to overlap.
+    """
+    name = backup['filename']
+    if name.startswith('verification_') and '_to_' in name:
+        try:
+            backup_start, backup_end = parse_date_range(
+                name[len('verification_'):].replace('_to_', ':', 1)[:21]
+            )
+            return backup_start <= end and backup_end >= start
+        except ValueError:
+            return True
+
+    last_modified = backup.get('last_modified')
+    if isinstance(last_modified, datetime) and last_modified.tzinfo is not None:
+        return last_modified >= start
+    return True
+
+
 def restore_verification_scores(date_range: Optional[str] = None) -> int:
     """
     Download and import verification scores from cloud backup.
 
     Args:
-        date_range: Specific backup date range to restore (format: YYYYMMDD)
+        date_range: Either a backup date (format: YYYYMMDD) to restore that
+            backup file, or a valid_time range (format: YYYY-MM-DD:YYYY-MM-DD)
+            to restore only matching rows from all verification backups.
+            Range restores skip backups that cannot overlap the range
+            without downloading them, and filter the rest on valid_time.
 
     Returns:
         Number of records restored
     """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
     try:
         # List available backups
         backups = list_available_backups()
@@ -532,49 +899,72 @@ def restore_verification_scores(date_range: Optional[str] = None) -> int:
             logger.warning("No verification score backups found")
             return 0
 
-        # Find matching backup
-        if date_range:
+        # Find matching backups
+        filters = None
+        if date_range and ':' in date_range:
+            start, end = parse_date_range(date_range)
+            filters = [('valid_time', '>=', start), ('valid_time', '<=', end)]
+            selected = [b for b in verification_backups if _backup_may_overlap(b, start, end)]
+            logger.info(f"{len(selected)} of {len(verification_backups)} backups can overlap {date_range}")
+        elif date_range:
             matching = [b for b in verification_backups if date_range in b['filename']]
             if not matching:
                 logger.error(f"No backup found for date range: {date_range}")
                 return 0
-            backup = matching[0]
+            selected = matching[:1]
         else:
             # Use most recent
-            backup = verification_backups[0]
+            selected = verification_backups[:1]
 
-        logger.info(f"Restoring from: {backup['filename']}")
+        records_count = 0
+        restored_ids = None
 
-        # Download backup
-        temp_dir = Path("data/temp")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        local_file = temp_dir / backup['filename']
+        for backup in selected:
+            logger.info(f"Restoring from: {backup['filename']}")
 
-        if not download_from_cloud(backup['key'], local_file):
-            logger.error("Failed to download backup")
-            return 0
+            # Download backup into memory and read the Parquet payload without
+            # writing the compressed or decompressed file to disk
+            buffer = io.BytesIO()
+            if not download_fileobj_from_cloud(backup['key'], buffer):
+                logger.error("Failed to download backup")
+                continue
 
-        # Decompress
-        decompressed_file = local_file.with_suffix('')  # Remove .gz
-        with gzip.open(local_file, 'rb') as f_in:
-            with open(decompressed_file, 'wb') as f_out:
-                f_out.write(f_in.read())
+            table = pq.read_table(
+                pa.BufferReader(_gzip_module().decompress(buffer.getbuffer())),
+                filters=filters
+            )
+            buffer.close()
 
-        # Read Parquet
-        df = pd.read_parquet(decompressed_file)
-        records_count = len(df)
+            # Overlapping backups (range + incremental) can contain the same rows
+            if 'id' in table.column_names:
+                if restored_ids is not None:
+                    table = table.filter(pc.invert(pc.is_in(table['id'], value_set=restored_ids)))
+                ids = table['id'].combine_chunks()
+                restored_ids = ids if restored_ids is None else pa.concat_arrays([restored_ids, ids])
 
-        logger.info(f"Importing {records_count} records to database...")
+            if table.num_rows == 0:
+                logger.info("No matching records in this backup")
+                continue
 
-        # Import to database
-        with get_db_connection() as conn:
-            df.to_sql('verification_scores', conn, if_exists='append', index=False)
+            df = table.to_pandas()
+            logger.info(f"Importing {len(df)} records to database...")
 
-        logger.success(f"Restored {records_count} records")
+            # Bulk load with COPY instead of row-by-row INSERTs
+            csv_buffer = io.StringIO()
+            df.to_csv(csv_buffer, index=False, header=False)
+            csv_buffer.seek(0)
 
-        # Cleanup
-        local_file.unlink(missing_ok=True)
-        decompressed_file.unlink(missing_ok=True)
+            columns = ', '.join(df.columns)
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.copy_expert(
+                        f"COPY verification_scores ({columns}) FROM STDIN WITH (FORMAT csv)",
+                        csv_buffer
+                    )
+
+            records_count += len(df)
+
+        logger.success(f"Restored {records_count} records")
 
         return records_count
 
@@ -616,11 +1006,18 @@ def restore_database(backup_date: str) -> bool:
             logger.error("Failed to download backup")
             return False
 
-        # Decompress
+        # Decompress (.sql.zst dumps from zstd, .sql.gz from the gzip fallback)
         decompressed_file = local_file.with_suffix('')
-        with gzip.open(local_file, 'rb') as f_in:
-            with open(decompressed_file, 'wb') as f_out:
-                f_out.write(f_in.read())
+        if local_file.suffix == '.zst':
+            process = subprocess.run(
+                ['zstd', '-d', '--long=27', '-q', '-f', str(local_file), '-o', str(decompressed_file)],
+                capture_output=True,
+                text=True
+            )
+            if process.returncode != 0:
+                raise Exception(f"zstd decompression failed: {process.stderr}")
+        else:
+            gzip_decompress_file(local_file, decompressed_file)
 
         # Restore using psql
         logger.warning("This will overwrite the current database!")
@@ -1,21 +1,72 @@
 """Database connection utilities."""
+import os
+import threading
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from contextlib import contextmanager
 from src.config import settings
 
+# Process-wide connection pool, created on first use. Checkouts are gated by
+# _pool_slots so callers wait for a free connection instead of getting
+# PoolError when all settings.db_pool_max_connections are in use. _pool_pid
+# records the creating process: a forked child must not share its parent's
+# connections, so it builds its own pool
+_pool = None
+_pool_slots = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+def _get_pool():
+    """Return the shared connection pool and its checkout semaphore, creating them on first use."""
+    global _pool, _pool_slots, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                # After a fork the inherited pool belongs to the parent; drop it
+                # without closing, since closing would tear down its sockets
+                _pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=settings.db_pool_max_connections,
+                    dsn=settings.database_url,
+                    application_name='wx_or_not',
+                    options='-c statement_timeout=0'  # long-running exports
+                )
+                _pool_slots = threading.BoundedSemaphore(settings.db_pool_max_connections)
+                _pool_pid = os.getpid()
+    return _pool, _pool_slots
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    conn = psycopg2.connect(settings.database_url)
+    """
+    Context manager for pooled database connections.
+
+    Blocks while every pooled connection is checked out, for up to
+    settings.db_pool_timeout_seconds. A thread that already holds a
+    connection and asks for another counts twice against the limit.
+
+    Raises:
+        PoolError: If no connection frees up within the timeout
+    """
+    pool, slots = _get_pool()
+    if not slots.acquire(timeout=settings.db_pool_timeout_seconds):
+        raise PoolError(
+            f"No database connection free after {settings.db_pool_timeout_seconds}s "
+            f"({settings.db_pool_max_connections} in use)"
+        )
     try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
+        conn = pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
     finally:
-        conn.close()
+        slots.release()
 
 @contextmanager
 def get_db_cursor(dict_cursor=False):
@@ -1,11 +1,16 @@
 """Multi-tier storage management for weather model data."""
+import json
 import os
 import shutil
+import sqlite3
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple, Union
 from loguru import logger
-import psutil
 
 from src.config import settings
 
@@ -20,6 +25,359 @@ DATA_TYPE_RAW = 'raw'
 DATA_TYPE_PROCESSED = 'processed'
 DATA_TYPE_OBSERVATIONS = 'observations'
 
+# Storage roots, resolved once at import
+LOCAL_ROOT = Path(settings.local_storage_path)
+NAS_ROOT = Path(settings.nas_storage_path)
+
+# Per-directory scan cache, stored under the local storage root
+DIR_CACHE_NAME = '.wxcache.db'
+# Directories with changes more recent than this are always rescanned, since
+# in-place file writes do not bump the directory mtime
+DIR_CACHE_SETTLE_SECONDS = 3600
+# Cached summaries are trusted for at most this long. The directory mtime
+# only catches files being added, removed or renamed; this bounds how long a
+# file rewritten, appended to or truncated in place can go unnoticed
+DIR_CACHE_TTL_SECONDS = 24 * 3600
+
+# Chunk size for file copies when the kernel cannot copy for us
+COPY_BUFFER_SIZE = 1 << 20
+
+# Concurrent transfers for batched NAS moves
+NAS_MOVE_WORKERS = 8
+
+# Concurrent unlinks in cleanup_old_data (each is a round-trip on the NAS)
+DELETE_WORKERS = 16
+
+# Files between progress lines in long cleanup scans
+PROGRESS_LOG_INTERVAL = 1000
+
+
+class DiskUsage(NamedTuple):
+    """Filesystem usage in bytes (same fields as psutil.disk_usage)."""
+    total: int
+    used: int
+    free: int
+    percent: float
+
+
+def _disk_usage(path: Path) -> DiskUsage:
+    """
+    Filesystem usage for path from a single os.statvfs call.
+
+    Matches psutil.disk_usage: 'free' is the space available to unprivileged
+    users and 'percent' excludes root-reserved blocks.
+    """
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    denominator = used + free
+    percent = round(used / denominator * 100, 1) if denominator else 0.0
+    return DiskUsage(total, used, free, percent)
+
+
+def _scandir_recursive(path):
+    """
+    Recursively yield os.DirEntry objects for every regular file under path.
+
+    Symlinks are not followed. DirEntry caches its stat() result, so callers
+    get mtime and size from a single syscall per file, and entry.path is a
+    plain str - no Path objects are built during the walk.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _count_old(base_path: Union[str, Path], cutoff: float) -> Tuple[int, int]:
+    """
+    Count files under base_path last modified before cutoff.
+
+    Args:
+        base_path: Directory to walk
+        cutoff: Unix timestamp; files with an older mtime are counted
+
+    Returns:
+        Tuple of (file count, total size in bytes)
+    """
+    count = 0
+    total_size = 0
+    for entry in _scandir_recursive(base_path):
+        st = entry.stat(follow_symlinks=False)
+        if st.st_mtime < cutoff:
+            count += 1
+            total_size += st.st_size
+    return count, total_size
+
+
+def _unlink(path: str) -> bool:
+    """Delete a file, logging (not raising) on failure."""
+    try:
+        os.unlink(path)
+        return True
+    except OSError as e:
+        logger.error(f"Failed to delete {path}: {e}")
+        return False
+
+
+def _rmtree(path: str) -> bool:
+    """Delete a directory tree, logging (not raising) on failure."""
+    try:
+        shutil.rmtree(path)
+        return True
+    except OSError as e:
+        logger.error(f"Failed to delete {path}: {e}")
+        return False
+
+
+def _day_dir_date(entry) -> Optional[datetime]:
+    """Return the date of a YYYYMMDD directory entry, or None for anything else."""
+    name = entry.name
+    if len(name) != 8 or not name.isdigit() or not entry.is_dir(follow_symlinks=False):
+        return None
+    try:
+        return datetime.strptime(name, '%Y%m%d')
+    except ValueError:
+        return None
+
+
+def _open_dir_cache() -> Optional[sqlite3.Connection]:
+    """
+    Open the per-directory scan cache, or return None if it is unavailable.
+
+    The cache lives under LOCAL_ROOT; if that does not exist yet it is not
+    created here, and scans simply run uncached.
+    """
+    try:
+        if not LOCAL_ROOT.is_dir():
+            return None
+        conn = sqlite3.connect(str(LOCAL_ROOT / DIR_CACHE_NAME), timeout=30)
+        conn.execute("DROP TABLE IF EXISTS dir_cache")  # pre-TTL layout
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dir_summary (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                files_count INTEGER NOT NULL,
+                total_size INTEGER NOT NULL,
+                latest_mtime REAL NOT NULL,
+                subdirs TEXT NOT NULL,
+                scanned_at REAL NOT NULL
+            )
+        """)
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        logger.debug(f"Directory cache unavailable: {e}")
+        return None
+
+
+def _dir_summaries(base_path: Union[str, Path],
+                   scanned_files: Optional[Dict[str, List[os.stat_result]]] = None):
+    """
+    Yield (dir_path, files_count, total_size, latest_mtime) for every directory
+    under base_path, counting only the files directly inside each directory.
+
+    Summaries are cached per directory keyed by the directory's mtime, so a
+    directory whose entries have not changed costs a single stat() instead of
+    a stat() per file. That mtime only changes when entries are added,
+    removed or renamed, so the cache assumes files are written once:
+    directories touched within DIR_CACHE_SETTLE_SECONDS are always rescanned
+    and not cached, and cached rows older than DIR_CACHE_TTL_SECONDS are
+    rescanned to pick up files modified in place.
+
+    Args:
+        base_path: Directory tree to summarize
+        scanned_files: Optional dict; for each directory that is actually
+            scanned (not served from the cache) its files' stat results are
+            stored under its path before it is yielded, so callers needing
+            per-file detail do not scan it a second time
+    """
+    base = str(base_path)
+    cache = _open_dir_cache()
+    cached = {}
+    if cache is not None:
+        try:
+            # Only rows for this tree: the path itself and everything below it
+            below_start = base.rstrip(os.sep) + os.sep
+            below_end = base.rstrip(os.sep) + chr(ord(os.sep) + 1)
+            cached = {row[0]: row[1:] for row in cache.execute(
+                'SELECT * FROM dir_summary WHERE path = ? OR (path >= ? AND path < ?)',
+                (base, below_start, below_end)
+            )}
+        except sqlite3.Error as e:
+            logger.debug(f"Failed to read directory cache: {e}")
+
+    updates = []
+    now = time.time()
+    settled_before = now - DIR_CACHE_SETTLE_SECONDS
+    fresh_after = now - DIR_CACHE_TTL_SECONDS
+    stack = [base]
+
+    try:
+        while stack:
+            path = stack.pop()
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+
+            row = cached.get(path)
+            if row is not None and row[0] == mtime_ns and row[5] >= fresh_after:
+                _, files_count, total_size, latest_mtime, subdirs, _ = row
+                subdirs = json.loads(subdirs)
+            else:
+                files_count = total_size = 0
+                latest_mtime = 0.0
+                subdirs = []
+                file_stats = []
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name.startswith(DIR_CACHE_NAME):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            file_stats.append(st)
+                            files_count += 1
+                            total_size += st.st_size
+                            latest_mtime = max(latest_mtime, st.st_mtime)
+
+                if scanned_files is not None:
+                    scanned_files[path] = file_stats
+                if max(mtime_ns / 1e9, latest_mtime) < settled_before:
+                    updates.append((path, mtime_ns, files_count, total_size,
+                                    latest_mtime, json.dumps(subdirs), now))
+
+            yield path, files_count, total_size, latest_mtime
+            stack.extend(os.path.join(path, name) for name in subdirs)
+    finally:
+        if cache is not None:
+            try:
+                with cache:
+                    cache.executemany(
+                        'INSERT OR REPLACE INTO dir_summary VALUES (?, ?, ?, ?, ?, ?, ?)', updates
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"Failed to update directory cache: {e}")
+            cache.close()
+
+
+def _walk_size(base_path: Union[str, Path]) -> Tuple[int, int]:
+    """
+    Count all files under base_path, using the directory cache.
+
+    Returns:
+        Tuple of (file count, total size in bytes); (0, 0) if the path is missing
+    """
+    files_count = 0
+    total_size = 0
+    for _, count, size, _ in _dir_summaries(base_path):
+        files_count += count
+        total_size += size
+    return files_count, total_size
+
+
+def _fadvise(fd: int, size: int, advice: str) -> None:
+    """Apply a posix_fadvise hint where the platform supports it."""
+    if hasattr(os, 'posix_fadvise') and hasattr(os, advice):
+        try:
+            os.posix_fadvise(fd, 0, size, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _fastcopy(src: Path, dst: Path) -> int:
+    """
+    Copy src to dst, letting the kernel move the data where possible.
+
+    Tries os.copy_file_range (server-side copy on NFS, reflinks on CoW
+    filesystems), then os.sendfile, then a plain read/write loop with a
+    preallocated buffer. File metadata is copied afterwards as shutil.copy2
+    would. Both files are dropped from the page cache once the copy is
+    synced.
+
+    Returns:
+        Size of the destination file in bytes, from fstat on the open fd
+        after an fsync
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            size = os.fstat(src_fd).st_size
+            copied = 0
+            _fadvise(src_fd, size, 'POSIX_FADV_SEQUENTIAL')
+
+            if hasattr(os, 'copy_file_range'):
+                try:
+                    while copied < size:
+                        n = os.copy_file_range(src_fd, dst_fd, size - copied)
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError:
+                    pass
+
+            if copied < size and hasattr(os, 'sendfile'):
+                try:
+                    while copied < size:
+                        n = os.sendfile(dst_fd, src_fd, copied, min(COPY_BUFFER_SIZE, size - copied))
+                        if n == 0:
+                            break
+                        copied += n
+                except OSError:
+                    pass
+
+            if copied < size:
+                os.lseek(src_fd, copied, os.SEEK_SET)
+                os.lseek(dst_fd, copied, os.SEEK_SET)
+                buf = bytearray(COPY_BUFFER_SIZE)
+                view = memoryview(buf)
+                while True:
+                    n = os.readv(src_fd, [buf])
+                    if n == 0:
+                        break
+                    written = 0
+                    while written < n:
+                        written += os.write(dst_fd, view[written:n])
+
+            # Make sure the data is on the NAS before the caller deletes the source
+            os.fsync(dst_fd)
+            copied = os.fstat(dst_fd).st_size
+
+            # The moved file is not read again here; drop it from the page
+            # cache rather than evicting the working set
+            _fadvise(src_fd, size, 'POSIX_FADV_DONTNEED')
+            _fadvise(dst_fd, size, 'POSIX_FADV_DONTNEED')
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    shutil.copystat(src, dst)
+    return copied
+
+
+# Storage directories already created by get_storage_path in this process;
+# cleanup_old_data discards the ones it removes
+_created_paths = set()
+
+
+@lru_cache(maxsize=4096)
+def _storage_dir(data_type: str, date_str: str, tier: str) -> Path:
+    """Build base/data_type/YYYYMMDD for a tier (cached)."""
+    if tier == TIER_LOCAL:
+        base_path = LOCAL_ROOT
+    elif tier == TIER_NAS:
+        base_path = NAS_ROOT
+    else:
+        raise ValueError(f"Invalid tier: {tier}. Must be 'local' or 'nas'")
+
+    return base_path / data_type / date_str
+
 
 def get_storage_path(data_type: str, date: datetime, tier: str = 'local') -> Path:
     """
@@ -39,24 +397,16 @@ def get_storage_path(data_type: str, date: datetime, tier: str = 'local') -> Pat
         >>> get_storage_path('raw', datetime(2025, 11, 18), 'nas')
         Path('/mnt/nas/weather-data/raw/20251118')
     """
-    date_str = date.strftime('%Y%m%d')
-
-    if tier == TIER_LOCAL:
-        base_path = settings.local_storage_path
-    elif tier == TIER_NAS:
-        base_path = settings.nas_storage_path
-    else:
-        raise ValueError(f"Invalid tier: {tier}. Must be 'local' or 'nas'")
+    path = _storage_dir(data_type, date.strftime('%Y%m%d'), tier)
 
-    # Build path: base/data_type/YYYYMMDD
-    path = base_path / data_type / date_str
-
-    # Create directory if it doesn't exist
-    try:
-        path.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Ensured storage path exists: {path}")
-    except Exception as e:
-        logger.error(f"Failed to create storage path {path}: {e}")
+    # Create directory if it doesn't exist (once per process)
+    if path not in _created_paths:
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            _created_paths.add(path)
+            logger.debug(f"Ensured storage path exists: {path}")
+        except Exception as e:
+            logger.error(f"Failed to create storage path {path}: {e}")
 
     return path
 
@@ -78,26 +428,36 @@ def move_to_nas(file_path: str, delete_local: bool = True) -> bool:
 
     local_path = Path(file_path)
 
-    if not local_path.exists():
+    try:
+        local_stat = os.stat(local_path)
+    except FileNotFoundError:
         logger.error(f"Local file does not exist: {local_path}")
         return False
 
     try:
         # Determine the relative path from local storage
-        relative_path = local_path.relative_to(settings.local_storage_path)
+        relative_path = local_path.relative_to(LOCAL_ROOT)
 
         # Build NAS destination path
-        nas_path = settings.nas_storage_path / relative_path
+        nas_path = NAS_ROOT / relative_path
 
         # Ensure destination directory exists
         nas_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # Same filesystem: a rename is atomic and moves no data
+        if delete_local and os.stat(nas_path.parent).st_dev == local_stat.st_dev:
+            logger.info(f"Moving {local_path} → {nas_path} (rename)")
+            os.replace(local_path, nas_path)
+            logger.success(f"Successfully moved to NAS: {nas_path}")
+            return True
+
         # Copy file to NAS
         logger.info(f"Moving {local_path} → {nas_path}")
-        shutil.copy2(local_path, nas_path)
+        local_size = local_stat.st_size
+        copied_size = _fastcopy(local_path, nas_path)
 
         # Verify file integrity (compare sizes)
-        if local_path.stat().st_size != nas_path.stat().st_size:
+        if copied_size != local_size:
             logger.error(f"File size mismatch after copy: {local_path} vs {nas_path}")
             return False
 
@@ -105,7 +465,7 @@ def move_to_nas(file_path: str, delete_local: bool = True) -> bool:
 
         # Delete local file if requested
         if delete_local:
-            local_path.unlink()
+            os.unlink(local_path)
             logger.info(f"Deleted local file: {local_path}")
 
         return True
@@ -118,6 +478,32 @@ def move_to_nas(file_path: str, delete_local: bool = True) -> bool:
         return False
 
 
+def move_batch_to_nas(file_paths: List[Path], delete_local: bool = True,
+                      max_workers: int = NAS_MOVE_WORKERS) -> List[bool]:
+    """
+    Move many files from local to NAS storage concurrently.
+
+    Per-file NAS round-trips dominate when moving many small files, so the
+    moves are overlapped on a thread pool rather than run one after another.
+
+    Args:
+        file_paths: Local files to move
+        delete_local: Whether to delete each local file after a successful copy
+        max_workers: Number of concurrent transfers
+
+    Returns:
+        List of per-file results (True if moved), in the order of file_paths
+    """
+    if not settings.nas_enabled:
+        logger.debug("NAS not enabled, skipping move")
+        return [False] * len(file_paths)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda path: move_to_nas(str(path), delete_local=delete_local), file_paths
+        ))
+
+
 def archive_to_cloud(data_type: str, date_range: str) -> bool:
     """
     Export verification metrics to cloud storage.
@@ -157,12 +543,12 @@ def cleanup_old_data(data_type: str, age_days: int, tier: str = 'local', dry_run
         Number of files deleted (or would be deleted in dry_run mode)
     """
     if tier == TIER_LOCAL:
-        base_path = settings.local_storage_path / data_type
+        base_path = LOCAL_ROOT / data_type
     elif tier == TIER_NAS:
         if not settings.nas_enabled:
             logger.debug("NAS not enabled, skipping cleanup")
             return 0
-        base_path = settings.nas_storage_path / data_type
+        base_path = NAS_ROOT / data_type
     else:
         logger.error(f"Invalid tier: {tier}")
         return 0
@@ -173,27 +559,89 @@ def cleanup_old_data(data_type: str, age_days: int, tier: str = 'local', dry_run
 
     # Calculate cutoff time
     cutoff_time = datetime.now().timestamp() - (age_days * 24 * 3600)
+    cutoff_dt = datetime.fromtimestamp(cutoff_time)
     deleted_count = 0
     freed_space = 0
+    files_scanned = 0
+    delete_files = []
+    delete_dirs = []
 
     try:
-        # Walk through all files in the directory
-        for file_path in base_path.rglob('*'):
-            if file_path.is_file():
-                # Check file age
-                file_mtime = file_path.stat().st_mtime
-                if file_mtime < cutoff_time:
-                    file_size = file_path.stat().st_size
+        with os.scandir(base_path) as it:
+            top_entries = list(it)
+
+        for top in top_entries:
+            # YYYYMMDD directories are wholly older or newer than the cutoff
+            # unless they contain it, so most can be decided by name alone
+            day = _day_dir_date(top)
+            if day is not None:
+                if day >= cutoff_dt:
+                    continue
+
+                if day + timedelta(days=1) <= cutoff_dt:
+                    files_count, dir_size = _walk_size(top.path)
+                    freed_space += dir_size
+                    deleted_count += files_count
+
+                    if dry_run:
+                        logger.info(
+                            f"[DRY RUN] Would delete: {top.path} ({files_count} files, "
+                            f"{dir_size / 1024 / 1024:.2f} MB)"
+                        )
+                    else:
+                        logger.info(f"Deleting old directory: {top.path} ({files_count} files)")
+                        delete_dirs.append((top.path, files_count))
+                    continue
+
+            # Otherwise check each file's age
+            if top.is_dir(follow_symlinks=False):
+                entries = _scandir_recursive(top.path)
+            elif top.is_file(follow_symlinks=False):
+                entries = [top]
+            else:
+                continue
+
+            for entry in entries:
+                st = entry.stat(follow_symlinks=False)
+                if st.st_mtime < cutoff_time:
+                    file_size = st.st_size
                     freed_space += file_size
 
+                    # Per-file messages are debug-only and formatted lazily by
+                    # loguru; INFO gets a periodic progress line instead
                     if dry_run:
-                        logger.info(f"[DRY RUN] Would delete: {file_path} ({file_size / 1024 / 1024:.2f} MB)")
+                        logger.debug("[DRY RUN] Would delete: {} ({:.2f} MB)",
+                                     entry.path, file_size / 1024 / 1024)
                     else:
-                        logger.info(f"Deleting old file: {file_path}")
-                        file_path.unlink()
+                        logger.debug("Deleting old file: {}", entry.path)
+                        delete_files.append(entry.path)
 
                     deleted_count += 1
 
+                files_scanned += 1
+                if files_scanned % PROGRESS_LOG_INTERVAL == 0:
+                    logger.info(
+                        f"{tier}/{data_type}: scanned {files_scanned} files, "
+                        f"{deleted_count} to delete so far"
+                    )
+
+        # Deletes are independent and latency bound on the NAS, so run them
+        # concurrently once the scan is done
+        if delete_files or delete_dirs:
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                dir_results = executor.map(_rmtree, (path for path, _ in delete_dirs))
+                file_results = executor.map(_unlink, delete_files)
+
+                for (_, files_count), ok in zip(delete_dirs, dir_results):
+                    if not ok:
+                        deleted_count -= files_count
+                deleted_count -= sum(1 for ok in file_results if not ok)
+
+            # Removed day directories must be recreated if get_storage_path
+            # is asked for them again
+            for path, _ in delete_dirs:
+                _created_paths.discard(Path(path))
+
         mode = "[DRY RUN]" if dry_run else ""
         logger.success(
             f"{mode} Cleaned up {deleted_count} files from {tier}/{data_type}, "
@@ -206,6 +654,18 @@ def cleanup_old_data(data_type: str, age_days: int, tier: str = 'local', dry_run
     return deleted_count
 
 
+def _tier_stats(usage: DiskUsage, files_count: int, total_size: int) -> Dict[str, Any]:
+    """Build the get_storage_stats entry for one tier."""
+    return {
+        'total_space_gb': usage.total / (1024 ** 3),
+        'used_space_gb': usage.used / (1024 ** 3),
+        'free_space_gb': usage.free / (1024 ** 3),
+        'usage_percent': usage.percent,
+        'files_count': files_count,
+        'total_size_gb': total_size / (1024 ** 3)
+    }
+
+
 def get_storage_stats() -> Dict[str, Dict[str, Any]]:
     """
     Get storage statistics for all tiers.
@@ -225,29 +685,25 @@ def get_storage_stats() -> Dict[str, Dict[str, Any]]:
         }
     """
     stats = {}
+    local_path = LOCAL_ROOT
+    nas_path = NAS_ROOT
+
+    # Disk usage and file walks are I/O bound (especially on the NAS), so
+    # start them all up front; the GIL is released during the syscalls. Even
+    # the NAS existence check happens on a worker (disk_usage raises
+    # FileNotFoundError) so nothing here blocks on a NAS round-trip.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        local_usage = executor.submit(_disk_usage, local_path)
+        local_walk = executor.submit(_walk_size, local_path)
+        if settings.nas_enabled:
+            nas_usage = executor.submit(_disk_usage, nas_path)
+            nas_walk = executor.submit(_walk_size, nas_path)
 
     # Local storage stats
     try:
-        local_path = settings.local_storage_path
-        usage = psutil.disk_usage(str(local_path))
-
-        # Count files and total size
-        files_count = 0
-        total_size = 0
-        if local_path.exists():
-            for file_path in local_path.rglob('*'):
-                if file_path.is_file():
-                    files_count += 1
-                    total_size += file_path.stat().st_size
-
-        stats['local'] = {
-            'total_space_gb': usage.total / (1024 ** 3),
-            'used_space_gb': usage.used / (1024 ** 3),
-            'free_space_gb': usage.free / (1024 ** 3),
-            'usage_percent': usage.percent,
-            'files_count': files_count,
-            'total_size_gb': total_size / (1024 ** 3)
-        }
+        usage = local_usage.result()
+        files_count, total_size = local_walk.result()
+        stats['local'] = _tier_stats(usage, files_count, total_size)
     except Exception as e:
         logger.error(f"Failed to get local storage stats: {e}")
         stats['local'] = {'error': str(e)}
@@ -255,28 +711,11 @@ def get_storage_stats() -> Dict[str, Dict[str, Any]]:
     # NAS storage stats (if enabled)
     if settings.nas_enabled:
         try:
-            nas_path = settings.nas_storage_path
-            if nas_path.exists():
-                usage = psutil.disk_usage(str(nas_path))
-
-                # Count files and total size
-                files_count = 0
-                total_size = 0
-                for file_path in nas_path.rglob('*'):
-                    if file_path.is_file():
-                        files_count += 1
-                        total_size += file_path.stat().st_size
-
-                stats['nas'] = {
-                    'total_space_gb': usage.total / (1024 ** 3),
-                    'used_space_gb': usage.used / (1024 ** 3),
-                    'free_space_gb': usage.free / (1024 ** 3),
-                    'usage_percent': usage.percent,
-                    'files_count': files_count,
-                    'total_size_gb': total_size / (1024 ** 3)
-                }
-            else:
-                stats['nas'] = {'error': 'NAS path does not exist'}
+            usage = nas_usage.result()
+            files_count, total_size = nas_walk.result()
+            stats['nas'] = _tier_stats(usage, files_count, total_size)
+        except FileNotFoundError:
+            stats['nas'] = {'error': 'NAS path does not exist'}
         except Exception as e:
             logger.error(f"Failed to get NAS storage stats: {e}")
             stats['nas'] = {'error': str(e)}
@@ -297,16 +736,16 @@ def check_available_space(tier: str) -> Dict[str, float]:
         - usage_percent: Disk usage percentage
     """
     if tier == TIER_LOCAL:
-        path = settings.local_storage_path
+        path = LOCAL_ROOT
     elif tier == TIER_NAS:
         if not settings.nas_enabled:
             return {'error': 'NAS not enabled'}
-        path = settings.nas_storage_path
+        path = NAS_ROOT
     else:
         return {'error': f'Invalid tier: {tier}'}
 
     try:
-        usage = psutil.disk_usage(str(path))
+        usage = _disk_usage(path)
         return {
             'free_space_gb': usage.free / (1024 ** 3),
             'usage_percent': usage.percent
@@ -329,11 +768,11 @@ def estimate_daily_usage(data_type: str, tier: str = 'local', days_to_analyze: i
         Estimated daily usage in GB/day
     """
     if tier == TIER_LOCAL:
-        base_path = settings.local_storage_path / data_type
+        base_path = LOCAL_ROOT / data_type
     elif tier == TIER_NAS:
         if not settings.nas_enabled:
             return 0.0
-        base_path = settings.nas_storage_path / data_type
+        base_path = NAS_ROOT / data_type
     else:
         return 0.0
 
@@ -341,17 +780,31 @@ def estimate_daily_usage(data_type: str, tier: str = 'local', days_to_analyze: i
         return 0.0
 
     try:
-        # Collect file sizes by day
-        daily_sizes: Dict[str, int] = {}
-        cutoff_time = datetime.now() - timedelta(days=days_to_analyze)
-
-        for file_path in base_path.rglob('*'):
-            if file_path.is_file():
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_mtime >= cutoff_time:
-                    date_key = file_mtime.strftime('%Y-%m-%d')
-                    file_size = file_path.stat().st_size
-                    daily_sizes[date_key] = daily_sizes.get(date_key, 0) + file_size
+        # Collect file sizes by day, keyed by local day number since the epoch
+        daily_sizes: Dict[int, int] = defaultdict(int)
+        cutoff_ts = (datetime.now() - timedelta(days=days_to_analyze)).timestamp()
+        utc_offset = time.localtime().tm_gmtoff
+
+        # Directories the summary pass had to scan hand over their file stats,
+        # so only directories served from the cache are listed again here
+        scanned_files: Dict[str, List[os.stat_result]] = {}
+
+        for dir_path, _, _, latest_mtime in _dir_summaries(base_path, scanned_files):
+            file_stats = scanned_files.pop(dir_path, None)
+
+            # Directories with nothing newer than the cutoff need no file stats
+            if latest_mtime < cutoff_ts:
+                continue
+
+            if file_stats is None:
+                with os.scandir(dir_path) as it:
+                    file_stats = [entry.stat(follow_symlinks=False) for entry in it
+                                  if entry.is_file(follow_symlinks=False)
+                                  and not entry.name.startswith(DIR_CACHE_NAME)]
+
+            for st in file_stats:
+                if st.st_mtime >= cutoff_ts:
+                    daily_sizes[int((st.st_mtime + utc_offset) // 86400)] += st.st_size
 
         if not daily_sizes:
             return 0.0
@@ -369,72 +822,52 @@ def estimate_daily_usage(data_type: str, tier: str = 'local', days_to_analyze: i
         return 0.0
 
 
-def recommend_cleanup() -> List[Dict[str, Any]]:
+def recommend_cleanup() -> Iterator[Dict[str, Any]]:
     """
     Recommend files to delete based on retention policies.
 
-    Returns:
-        List of recommendations with:
+    Recommendations are yielded as each scan completes (in tier/data type
+    order); wrap in list() if they are needed more than once.
+
+    Yields:
+        Recommendations with:
         - tier: Storage tier
         - data_type: Type of data
         - action: Recommended action
         - files_count: Number of files affected
         - space_freed_gb: Space that would be freed
     """
-    recommendations = []
-
-    # Check local storage for raw forecasts older than retention policy
-    for data_type in ['raw', 'processed', 'observations']:
-        if data_type == 'observations':
-            retention_days = settings.retention_observations_days
-        else:
-            retention_days = settings.retention_raw_forecasts_days
-
-        # Check local tier
-        local_path = settings.local_storage_path / data_type
-        if local_path.exists():
-            cutoff_time = datetime.now().timestamp() - (retention_days * 24 * 3600)
-            old_files = []
-            total_size = 0
-
-            for file_path in local_path.rglob('*'):
-                if file_path.is_file():
-                    file_mtime = file_path.stat().st_mtime
-                    if file_mtime < cutoff_time:
-                        old_files.append(file_path)
-                        total_size += file_path.stat().st_size
-
-            if old_files:
-                recommendations.append({
-                    'tier': 'local',
+    retention = {
+        DATA_TYPE_RAW: settings.retention_raw_forecasts_days,
+        DATA_TYPE_PROCESSED: settings.retention_raw_forecasts_days,
+        DATA_TYPE_OBSERVATIONS: settings.retention_observations_days,
+    }
+    tiers = [(TIER_LOCAL, LOCAL_ROOT)]
+    if settings.nas_enabled:
+        tiers.append((TIER_NAS, NAS_ROOT))
+
+    now_ts = datetime.now().timestamp()
+    scans = []
+
+    # Each (tier, data_type) subtree is scanned independently; NAS scans are
+    # latency bound, so fan them all out and collect the results in order.
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        for data_type, retention_days in retention.items():
+            cutoff_time = now_ts - retention_days * 86400
+
+            for tier, root in tiers:
+                base_path = os.path.join(root, data_type)
+                if os.path.isdir(base_path):
+                    future = executor.submit(_count_old, base_path, cutoff_time)
+                    scans.append((tier, data_type, retention_days, future))
+
+        for tier, data_type, retention_days, future in scans:
+            files_count, total_size = future.result()
+            if files_count:
+                yield {
+                    'tier': tier,
                     'data_type': data_type,
                     'action': f'Delete files older than {retention_days} days',
-                    'files_count': len(old_files),
+                    'files_count': files_count,
                     'space_freed_gb': total_size / (1024 ** 3)
-                })
-
-        # Check NAS tier if enabled
-        if settings.nas_enabled:
-            nas_path = settings.nas_storage_path / data_type
-            if nas_path.exists():
-                cutoff_time = datetime.now().timestamp() - (retention_days * 24 * 3600)
-                old_files = []
-                total_size = 0
-
-                for file_path in nas_path.rglob('*'):
-                    if file_path.is_file():
-                        file_mtime = file_path.stat().st_mtime
-                        if file_mtime < cutoff_time:
-                            old_files.append(file_path)
-                            total_size += file_path.stat().st_size
-
-                if old_files:
-                    recommendations.append({
-                        'tier': 'nas',
-                        'data_type': data_type,
-                        'action': f'Delete files older than {retention_days} days',
-                        'files_count': len(old_files),
-                        'space_freed_gb': total_size / (1024 ** 3)
-                    })
-
-    return recommendations
+                }
@@ -8,14 +8,28 @@ Matches forecasts to observations and calculates BOTH:
 Key Principle: A forecast's value is measured by the decisions it enables,
 not just its statistical accuracy.
 """
+import math
 import sys
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from itertools import compress
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any
-from math import radians, sin, cos, sqrt, atan2
 import pandas as pd
 import numpy as np
 from loguru import logger
+from psycopg2.extras import execute_values
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # optional; matching falls back to per-valid-time BallTrees
+    prange = range
+    NUMBA_AVAILABLE = False
 
 # Add parent directory for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -69,6 +83,16 @@ VARIABLE_MAPPINGS = {
     },
 }
 
+# Reasons an observation fails QC
+QC_MISSING = 'missing'
+QC_OUT_OF_RANGE = 'out_of_range'
+
+# default_thresholds per variable as arrays, ready for vectorized comparison
+DEFAULT_THRESHOLDS = {
+    var: np.asarray(config.get('default_thresholds', []), dtype=np.float64)
+    for var, config in VARIABLE_MAPPINGS.items()
+}
+
 # Reasonable ranges for QC
 REASONABLE_RANGES = {
     'temperature_2m': (213.15, 333.15),  # -60°C to 60°C in Kelvin
@@ -76,6 +100,134 @@ REASONABLE_RANGES = {
     'mslp': (90000, 110000),  # 900-1100 hPa in Pa
 }
 
+# Read-only float bounds for the QC hot path; variables without a range
+# fall back to _NO_BOUNDS, which every finite or infinite value passes
+_QC_BOUNDS = MappingProxyType({
+    variable: (float(min_val), float(max_val))
+    for variable, (min_val, max_val) in REASONABLE_RANGES.items()
+})
+_NO_BOUNDS = (-math.inf, math.inf)
+
+# Sentinel values feeds use for a missing observation
+_MISSING_SENTINELS = (999.9, -999.9)
+
+
+EARTH_RADIUS_KM = 6371.0
+
+# Scalar haversine constants, folded so the hot path skips a multiply each
+_EARTH_DIAMETER_KM = 2 * EARTH_RADIUS_KM
+_D2R = math.pi / 180.0
+_HALF_D2R = _D2R * 0.5
+
+# Float type for the radian coordinates scanned when matching; float32
+# keeps matched distances within a metre
+MATCH_DTYPE = np.float32
+
+# Rows per INSERT statement when storing verification results
+STORE_PAGE_SIZE = 1000
+
+# Observation rows streamed and verified per batch
+OBS_BATCH_SIZE = 10000
+
+# Minimum minutes between refreshes of skill_metrics_summary
+SKILL_REFRESH_INTERVAL_MINUTES = 5
+
+# skill_metrics_summary rows per read, and the metric columns kept as float32
+SKILL_READ_CHUNK_SIZE = 100_000
+SKILL_FLOAT_COLUMNS = ['mae', 'rmse', 'bias', 'hit_rate', 'false_alarm_rate',
+                       'false_alarm_ratio', 'csi', 'accuracy']
+
+
+def haversine_distance_batch(lat1, lon1, lat2, lon2, dtype=np.float64) -> np.ndarray:
+    """
+    Vectorized great circle distance in kilometers.
+
+    Arguments may be scalars or arrays and broadcast against each other, so
+    one point can be compared against many in a single pass.
+
+    Args:
+        lat1, lon1: First point(s) coordinates in degrees
+        lat2, lon2: Second point(s) coordinates in degrees
+        dtype: Float type to compute in; np.float32 halves memory traffic for
+            large station lists and stays within metres at matching distances
+
+    Returns:
+        Distance(s) in kilometers, as dtype
+    """
+    return _haversine_rad(*(np.radians(np.asarray(x, dtype=dtype))
+                            for x in (lat1, lon1, lat2, lon2)))
+
+
+def make_haversine_from(lat0: float, lon0: float):
+    """
+    Specialize haversine_distance_batch to one fixed reference point.
+
+    The reference point's radians and cosine are computed once here rather
+    than broadcast through every call, for the common one-forecast-point
+    against many-observations case.
+
+    Args:
+        lat0, lon0: Reference point coordinates in degrees
+
+    Returns:
+        Function (lats, lons) -> distances in kilometers from the reference point
+    """
+    lat0_rad = lat0 * _D2R
+    cos_lat0 = math.cos(lat0_rad)
+
+    def distance_from(lats, lons) -> np.ndarray:
+        lats_rad = np.asarray(lats, dtype=np.float64) * _D2R
+        s_lat = np.sin((lats_rad - lat0_rad) * 0.5)
+        s_lon = np.sin((np.asarray(lons, dtype=np.float64) - lon0) * _HALF_D2R)
+        a = s_lat * s_lat + cos_lat0 * np.cos(lats_rad) * s_lon * s_lon
+        return _EARTH_DIAMETER_KM * np.arcsin(np.sqrt(a))
+
+    return distance_from
+
+
+def _haversine_rad(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """haversine_distance_batch for coordinates already in radians."""
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(a))
+
+
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Scalar great circle distance in kilometers between two points in radians.
+
+    Compiled with numba as a nogil native function when it is installed, so
+    compiled kernels such as match_nearest can call it from parallel loops.
+    """
+    s_lat = math.sin((lat2 - lat1) * 0.5)
+    s_lon = math.sin((lon2 - lon1) * 0.5)
+    a = s_lat * s_lat + math.cos(lat1) * math.cos(lat2) * s_lon * s_lon
+    return _EARTH_DIAMETER_KM * math.asin(math.sqrt(a))
+
+
+if NUMBA_AVAILABLE:
+    _haversine_km = njit(nogil=True, cache=True, fastmath=True)(_haversine_km)
+
+
+def _haversine_deg(lat1, lon1, lat2, lon2):
+    """_haversine_km for coordinates in degrees; the scalar path behind haversine_distance."""
+    s_lat = math.sin((lat2 - lat1) * _HALF_D2R)
+    s_lon = math.sin((lon2 - lon1) * _HALF_D2R)
+    a = s_lat * s_lat + math.cos(lat1 * _D2R) * math.cos(lat2 * _D2R) * s_lon * s_lon
+    return _EARTH_DIAMETER_KM * math.asin(math.sqrt(a))
+
+
+if NUMBA_AVAILABLE:
+    # Eager signature: compiled (or loaded from cache) at import, not on first call
+    _haversine_deg = njit('f8(f8, f8, f8, f8)', nogil=True, cache=True, fastmath=True)(_haversine_deg)
+
+
+def _to_datetime64(times) -> np.ndarray:
+    """Convert datetimes to a datetime64[s] array via their POSIX timestamps."""
+    return np.array([int(t.timestamp()) for t in times], dtype=np.int64).astype('datetime64[s]')
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -88,22 +240,39 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in kilometers
     """
-    R = 6371  # Earth radius in km
+    return float(_haversine_deg(lat1, lon1, lat2, lon2))
 
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
 
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
+def quality_check_reason(obs_value: float, variable: str) -> Optional[str]:
+    """
+    Basic QC checks for observations, reporting why a value fails.
+
+    Args:
+        obs_value: Observed value
+        variable: Variable name
+
+    Returns:
+        None if the observation passes QC, otherwise QC_MISSING or QC_OUT_OF_RANGE
+    """
+    # Missing value indicators; NaN is the only value not equal to itself
+    if obs_value is None or obs_value != obs_value or obs_value in _MISSING_SENTINELS:
+        return QC_MISSING
+
+    # Physically reasonable range
+    min_val, max_val = _QC_BOUNDS.get(variable, _NO_BOUNDS)
+    if not (min_val <= obs_value <= max_val):
+        return QC_OUT_OF_RANGE
 
-    return R * c
+    return None
 
 
 def quality_check_observation(obs_value: float, variable: str) -> bool:
     """
     Basic QC checks for observations.
 
+    Failures are not logged here; batch callers aggregate them (see
+    quality_check_batch).
+
     Args:
         obs_value: Observed value
         variable: Variable name
@@ -111,116 +280,400 @@ def quality_check_observation(obs_value: float, variable: str) -> bool:
     Returns:
         True if observation passes QC, False otherwise
     """
-    # Check for missing value indicators
-    if obs_value is None or np.isnan(obs_value) or obs_value == 999.9 or obs_value == -999.9:
-        return False
+    return quality_check_reason(obs_value, variable) is None
 
-    # Check physically reasonable range
-    if variable in REASONABLE_RANGES:
-        min_val, max_val = REASONABLE_RANGES[variable]
-        if not (min_val <= obs_value <= max_val):
-            logger.warning(f"Value {obs_value} for {variable} outside reasonable range {REASONABLE_RANGES[variable]}")
-            return False
 
-    return True
+def quality_check_batch(obs_values, variables,
+                        bad_counts: Optional[Dict[str, Counter]] = None) -> np.ndarray:
+    """
+    Vectorized quality_check_observation over many observations.
 
+    Failures are counted per variable and reason. With bad_counts the counts
+    are added to it for the caller to report (see log_qc_summary); without,
+    they are logged here as one warning per variable.
 
-def calculate_statistical_metrics(forecast_value: float, observed_value: float) -> Dict[str, float]:
+    Args:
+        obs_values: Observed values (None is treated as missing)
+        variables: Variable name for each value, or one name for all of them
+        bad_counts: Optional {variable: Counter(reason)} to accumulate into
+
+    Returns:
+        Boolean mask, True where the observation passes QC
+    """
+    values = np.asarray(obs_values, dtype=np.float64)
+    if isinstance(variables, str):
+        variables = np.full(values.shape, variables, dtype=object)
+    variables = np.asarray(variables, dtype=object)
+    counts = bad_counts if bad_counts is not None else defaultdict(Counter)
+
+    # Missing value indicators
+    missing = np.isnan(values) | np.isin(values, _MISSING_SENTINELS)
+    for variable, count in Counter(variables[missing].tolist()).items():
+        counts[variable][QC_MISSING] += count
+    mask = ~missing
+
+    # Physically reasonable ranges
+    for variable, (min_val, max_val) in _QC_BOUNDS.items():
+        out_of_range = mask & (variables == variable) & ~((values >= min_val) & (values <= max_val))
+        bad_count = int(out_of_range.sum())
+        if bad_count:
+            counts[variable][QC_OUT_OF_RANGE] += bad_count
+            mask &= ~out_of_range
+
+    if bad_counts is None:
+        log_qc_summary(counts)
+
+    return mask
+
+
+def log_qc_summary(bad_counts: Dict[str, Counter]) -> None:
+    """Log one warning per variable with the number of observations QC dropped, by reason."""
+    for variable, reasons in bad_counts.items():
+        logger.warning(f"QC dropped {sum(reasons.values())} {variable} obs: {dict(reasons)}")
+
+
+@dataclass(slots=True, frozen=True)
+class StatMetrics(Mapping):
+    """
+    Traditional statistical verification metrics for a forecast/observation pair.
+
+    The object is also a read-only mapping of field name to value, so
+    metrics['error'], 'error' in metrics, metrics.get() and metrics.keys()
+    behave as with the dict calculate_statistical_metrics used to return.
+    """
+    error: float
+    absolute_error: float
+    squared_error: float
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+
+# Input types calculate_statistical_metrics memoizes; anything else is computed directly
+_CACHEABLE_SCALARS = (int, float, np.integer, np.floating)
+
+
+def calculate_statistical_metrics(forecast_value: float, observed_value: float) -> StatMetrics:
     """
     Calculate traditional statistical verification metrics.
 
     Returns:
-        Dictionary with error, absolute_error, squared_error
+        StatMetrics with error, absolute_error, squared_error
+    """
+    if isinstance(forecast_value, _CACHEABLE_SCALARS) and isinstance(observed_value, _CACHEABLE_SCALARS):
+        return _stats_cached(forecast_value, observed_value)
+    return _stats_cached.__wrapped__(forecast_value, observed_value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _stats_cached(forecast_value: float, observed_value: float) -> StatMetrics:
+    """
+    calculate_statistical_metrics, memoized for repeated pairs (persistence
+    forecasts, climatology references). StatMetrics is frozen, so sharing
+    one instance between callers is safe; typed keeps int and float inputs apart.
     """
     error = forecast_value - observed_value
-    return {
-        'error': error,
-        'absolute_error': abs(error),
-        'squared_error': error ** 2,
-    }
+    return StatMetrics(error, abs(error), error * error)
+
+
+def calculate_statistical_metrics_batch(forecast_values, observed_values) -> StatMetrics:
+    """
+    Vectorized calculate_statistical_metrics over many pairs.
+
+    Returns:
+        StatMetrics whose fields are float64 arrays, one element per pair
+    """
+    error = np.asarray(forecast_values, dtype=np.float64) - np.asarray(observed_values, dtype=np.float64)
+    return StatMetrics(error, np.abs(error), error * error)
+
+
+# Vectorized comparison for each threshold operator (anything else is '<=')
+THRESHOLD_OPERATORS = {
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '<': np.less,
+    '<=': np.less_equal,
+}
+
+# Outcome names indexed by 2 * forecast_exceeds + observed_exceeds: interned
+# strings for per-pair results and rows, and an array for vectorized lookup
+_OUTCOMES = tuple(sys.intern(name) for name in ('correct_negative', 'miss', 'false_alarm', 'hit'))
+_OUTCOME_NAMES = np.array(_OUTCOMES)
+
+# Position of each outcome in a contingency count array
+OUTCOME_IDX = {'hit': 0, 'miss': 1, 'false_alarm': 2, 'correct_negative': 3}
+
+
+# Integer codes for THRESHOLD_OPERATORS in the compiled threshold kernel
+# (anything else is '<=')
+_OPERATOR_CODES = {'>': 0, '>=': 1, '<': 2, '<=': 3}
+
+# Thresholds per call at or above which the parallel threshold kernel is
+# used; below it, thread start-up costs more than the comparisons
+THRESHOLD_PARALLEL_MIN = 1024
+
+
+def _threshold_kernel(forecast, observed, thresholds, op_code):
+    """
+    Outcome code (2 * forecast_exceeds + observed_exceeds) for each threshold.
+
+    Compiled with numba when it is installed, as a serial kernel and as a
+    parallel one over the threshold axis; each threshold writes only its
+    own code.
+    """
+    n = thresholds.shape[0]
+    codes = np.empty(n, dtype=np.uint8)
+
+    for i in prange(n):
+        threshold = thresholds[i]
+        if op_code == 0:
+            fe = forecast > threshold
+            oe = observed > threshold
+        elif op_code == 1:
+            fe = forecast >= threshold
+            oe = observed >= threshold
+        elif op_code == 2:
+            fe = forecast < threshold
+            oe = observed < threshold
+        else:
+            fe = forecast <= threshold
+            oe = observed <= threshold
+        codes[i] = 2 * fe + oe
+
+    return codes
+
+
+if NUMBA_AVAILABLE:
+    _threshold_kernel_parallel = njit(parallel=True, nogil=True, cache=True)(_threshold_kernel)
+    _threshold_kernel = njit(nogil=True, cache=True)(_threshold_kernel)
+
+
+class ThresholdResult(Mapping):
+    """
+    Contingency outcomes of one forecast/observation pair against K thresholds.
+
+    Results are held as arrays in threshold order (thresholds, codes, and the
+    outcomes and exceedance flags derived from them). For compatibility the
+    object is also a read-only mapping keyed by threshold value, so
+    result[101000.0]['outcome'] looks the threshold up by binary search
+    instead of hashing a float.
+    """
+    __slots__ = ('thresholds', 'codes', 'operator', '_order', '_sorted')
+
+    def __init__(self, thresholds: np.ndarray, codes: np.ndarray, operator: str):
+        self.thresholds = thresholds
+        self.codes = codes  # 2 * forecast_exceeds + observed_exceeds
+        self.operator = operator
+        self._order = None
+        self._sorted = None
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        return _OUTCOME_NAMES[self.codes]
+
+    @property
+    def forecast_exceeds(self) -> np.ndarray:
+        return self.codes >= 2
+
+    @property
+    def observed_exceeds(self) -> np.ndarray:
+        return (self.codes & 1).astype(bool)
+
+    def index(self, threshold: float) -> int:
+        """Position of threshold in self.thresholds; KeyError if it is not one of them."""
+        if self._sorted is None:
+            self._order = np.argsort(self.thresholds, kind='stable')
+            self._sorted = self.thresholds[self._order]
+        pos = int(np.searchsorted(self._sorted, threshold))
+        if pos < self._sorted.size and self._sorted[pos] == threshold:
+            return int(self._order[pos])
+        raise KeyError(threshold)
+
+    def __getitem__(self, threshold: float) -> Dict:
+        code = int(self.codes[self.index(threshold)])
+        return {
+            'outcome': _OUTCOMES[code],
+            'forecast_exceeds': code >= 2,
+            'observed_exceeds': bool(code & 1),
+            'operator': self.operator
+        }
+
+    def __iter__(self):
+        return iter(self.thresholds.tolist())
+
+    def __len__(self) -> int:
+        return self.thresholds.size
 
 
 def calculate_threshold_metrics(forecast_value: float, observed_value: float,
-                                thresholds: List[float], operator: str = '>') -> Dict[float, Dict]:
+                                thresholds: List[float], operator: str = '>') -> ThresholdResult:
     """
     Calculate decision-relevant metrics for operational thresholds.
 
     Args:
         forecast_value: Model forecast
         observed_value: Observed value
-        thresholds: List of decision thresholds
+        thresholds: List or array of decision thresholds
         operator: Comparison operator ('>', '<', '>=', '<=')
 
     Returns:
-        Dictionary keyed by threshold with contingency table results
-    """
-    results = {}
-
-    for threshold in thresholds:
-        if operator == '>':
-            forecast_exceeds = forecast_value > threshold
-            observed_exceeds = observed_value > threshold
-        elif operator == '>=':
-            forecast_exceeds = forecast_value >= threshold
-            observed_exceeds = observed_value >= threshold
-        elif operator == '<':
-            forecast_exceeds = forecast_value < threshold
-            observed_exceeds = observed_value < threshold
-        else:  # '<='
-            forecast_exceeds = forecast_value <= threshold
-            observed_exceeds = observed_value <= threshold
-
-        # Determine outcome
-        if forecast_exceeds and observed_exceeds:
-            outcome = 'hit'
-        elif not forecast_exceeds and observed_exceeds:
-            outcome = 'miss'  # WORST - didn't warn when should have
-        elif forecast_exceeds and not observed_exceeds:
-            outcome = 'false_alarm'  # COSTLY - unnecessary action
-        else:
-            outcome = 'correct_negative'
+        ThresholdResult with contingency table results, indexable by threshold
+    """
+    limits = np.asarray(thresholds, dtype=np.float64)
 
-        results[threshold] = {
-            'outcome': outcome,
-            'forecast_exceeds': forecast_exceeds,
-            'observed_exceeds': observed_exceeds,
-            'operator': operator
-        }
+    if NUMBA_AVAILABLE:
+        kernel = _threshold_kernel_parallel if limits.size >= THRESHOLD_PARALLEL_MIN else _threshold_kernel
+        codes = kernel(float(forecast_value), float(observed_value), limits,
+                       _OPERATOR_CODES.get(operator, 3))
+    else:
+        compare = THRESHOLD_OPERATORS.get(operator, np.less_equal)
+        codes = (2 * compare(forecast_value, limits) + compare(observed_value, limits)).astype(np.uint8)
 
-    return results
+    return ThresholdResult(limits, codes, operator)
 
 
-def calculate_decision_scores(contingency_counts: Dict[str, int]) -> Dict[str, float]:
+def _sorted_threshold_counts(forecast_pos: np.ndarray, observed_pos: np.ndarray,
+                             k: int, exceeds_below_pos: bool) -> np.ndarray:
     """
-    Calculate aggregate decision quality metrics from contingency table.
+    (K, 4) contingency counts, ordered by OUTCOME_IDX, from searchsorted positions.
+
+    With non-decreasing thresholds each value exceeds a prefix of them (j <
+    pos, for '>' and '>=') or a suffix (j >= pos, for '<' and '<='), so
+    counts per threshold come from cumulative histograms of the positions
+    in O(N + K) rather than four reductions over (N, K) masks.
+    """
+    n = forecast_pos.size
+
+    if exceeds_below_pos:
+        def exceeding(pos):
+            return n - np.cumsum(np.bincount(pos, minlength=k + 1))[:k]
+        both_pos = np.minimum(forecast_pos, observed_pos)
+    else:
+        def exceeding(pos):
+            return np.cumsum(np.bincount(pos, minlength=k + 1))[:k]
+        both_pos = np.maximum(forecast_pos, observed_pos)
+
+    hits = exceeding(both_pos)
+    forecast_yes = exceeding(forecast_pos)
+    observed_yes = exceeding(observed_pos)
+
+    return np.stack([
+        hits,
+        observed_yes - hits,
+        forecast_yes - hits,
+        n - forecast_yes - observed_yes + hits,
+    ], axis=1)
+
+
+def calculate_threshold_outcomes(forecast_values, observed_values, thresholds: List[float],
+                                 operator: str = '>') -> Dict[str, np.ndarray]:
+    """
+    Batch version of calculate_threshold_metrics over many forecast/observation pairs.
+
+    Sorted (non-decreasing) thresholds take a faster path: each value is
+    located among them once with searchsorted, and the exceedance masks and
+    counts are derived from those positions instead of from N x K value
+    comparisons and reductions.
 
     Args:
-        contingency_counts: {'hits': int, 'misses': int, 'false_alarms': int, 'correct_negatives': int}
+        forecast_values: N model forecasts
+        observed_values: N observed values
+        thresholds: K decision thresholds
+        operator: Comparison operator ('>', '<', '>=', '<=')
 
     Returns:
-        Dictionary with decision metrics (hit_rate, FAR, CSI, etc.)
+        Dictionary with (N, K) 'forecast_exceeds' and 'observed_exceeds'
+        arrays (outcome codes are 2 * forecast_exceeds + observed_exceeds,
+        see _OUTCOMES), (K, 4) 'counts' ordered by OUTCOME_IDX, and the same
+        counts as K-length 'hits', 'misses', 'false_alarms' and
+        'correct_negatives'
     """
-    hits = contingency_counts.get('hits', 0)
-    misses = contingency_counts.get('misses', 0)
-    false_alarms = contingency_counts.get('false_alarms', 0)
-    correct_negatives = contingency_counts.get('correct_negatives', 0)
-    total = hits + misses + false_alarms + correct_negatives
+    if operator not in THRESHOLD_OPERATORS:
+        operator = '<='
+    limits = np.asarray(thresholds, dtype=np.float64)
+    forecast_values = np.asarray(forecast_values, dtype=np.float64)
+    observed_values = np.asarray(observed_values, dtype=np.float64)
+
+    if (np.all(limits[1:] >= limits[:-1])
+            and not (np.isnan(forecast_values).any() or np.isnan(observed_values).any())):
+        side = 'left' if operator in ('>', '<=') else 'right'
+        forecast_pos = np.searchsorted(limits, forecast_values, side=side)
+        observed_pos = np.searchsorted(limits, observed_values, side=side)
+        exceeds_below_pos = operator in ('>', '>=')
+
+        column = np.arange(limits.size)
+        if exceeds_below_pos:
+            fe = column < forecast_pos[:, None]
+            oe = column < observed_pos[:, None]
+        else:
+            fe = column >= forecast_pos[:, None]
+            oe = column >= observed_pos[:, None]
+        counts = _sorted_threshold_counts(forecast_pos, observed_pos, limits.size, exceeds_below_pos)
+    else:
+        compare = THRESHOLD_OPERATORS[operator]
+        fe = compare(forecast_values[:, None], limits[None, :])
+        oe = compare(observed_values[:, None], limits[None, :])
+        counts = np.stack([
+            (fe & oe).sum(axis=0),
+            (~fe & oe).sum(axis=0),
+            (fe & ~oe).sum(axis=0),
+            (~fe & ~oe).sum(axis=0),
+        ], axis=1)
+
+    return {
+        'forecast_exceeds': fe,
+        'observed_exceeds': oe,
+        'counts': counts,
+        'hits': counts[:, OUTCOME_IDX['hit']],
+        'misses': counts[:, OUTCOME_IDX['miss']],
+        'false_alarms': counts[:, OUTCOME_IDX['false_alarm']],
+        'correct_negatives': counts[:, OUTCOME_IDX['correct_negative']],
+    }
 
-    # Avoid division by zero
-    hit_rate = hits / (hits + misses) if (hits + misses) > 0 else 0.0
-    false_alarm_rate = false_alarms / (false_alarms + correct_negatives) if (false_alarms + correct_negatives) > 0 else 0.0
-    false_alarm_ratio = false_alarms / (false_alarms + hits) if (false_alarms + hits) > 0 else 0.0
-    accuracy = (hits + correct_negatives) / total if total > 0 else 0.0
-    csi = hits / (hits + misses + false_alarms) if (hits + misses + false_alarms) > 0 else 0.0
-    bias_score = (hits + false_alarms) / (hits + misses) if (hits + misses) > 0 else 0.0
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise numerator / denominator, 0.0 where the denominator is 0."""
+    return np.divide(numerator, denominator, out=np.zeros(denominator.shape, dtype=np.float64),
+                     where=denominator > 0)
+
+
+def calculate_decision_scores_batch(hits, misses, false_alarms,
+                                    correct_negatives) -> Dict[str, np.ndarray]:
+    """
+    Batch version of calculate_decision_scores over many contingency tables.
+
+    Args:
+        hits: Hit counts, one per cell (site, lead time, threshold, ...)
+        misses: Miss counts
+        false_alarms: False alarm counts
+        correct_negatives: Correct negative counts
+
+    Returns:
+        Dictionary of float64 score arrays (hit_rate, FAR, CSI, etc.) and
+        int64 count arrays, keyed as in calculate_decision_scores
+    """
+    hits = np.asarray(hits, dtype=np.int64)
+    misses = np.asarray(misses, dtype=np.int64)
+    false_alarms = np.asarray(false_alarms, dtype=np.int64)
+    correct_negatives = np.asarray(correct_negatives, dtype=np.int64)
+    observed_yes = hits + misses
+    total = observed_yes + false_alarms + correct_negatives
 
     return {
-        'hit_rate': hit_rate,  # POD - Probability of Detection
-        'false_alarm_rate': false_alarm_rate,
-        'false_alarm_ratio': false_alarm_ratio,
-        'accuracy': accuracy,
-        'csi': csi,  # Critical Success Index - KEY METRIC
-        'bias_score': bias_score,
+        'hit_rate': _safe_ratio(hits, observed_yes),  # POD - Probability of Detection
+        'false_alarm_rate': _safe_ratio(false_alarms, false_alarms + correct_negatives),
+        'false_alarm_ratio': _safe_ratio(false_alarms, false_alarms + hits),
+        'accuracy': _safe_ratio(hits + correct_negatives, total),
+        'csi': _safe_ratio(hits, observed_yes + false_alarms),  # Critical Success Index - KEY METRIC
+        'bias_score': _safe_ratio(hits + false_alarms, observed_yes),
         'hits': hits,
         'misses': misses,
         'false_alarms': false_alarms,
@@ -229,6 +682,58 @@ def calculate_decision_scores(contingency_counts: Dict[str, int]) -> Dict[str, f
     }
 
 
+def calculate_decision_scores(contingency_counts: Dict[str, int]) -> Dict[str, float]:
+    """
+    Calculate aggregate decision quality metrics from contingency table.
+
+    Args:
+        contingency_counts: {'hits': int, 'misses': int, 'false_alarms': int, 'correct_negatives': int}
+
+    Returns:
+        Dictionary with decision metrics (hit_rate, FAR, CSI, etc.)
+    """
+    scores = calculate_decision_scores_batch(
+        [contingency_counts.get('hits', 0)],
+        [contingency_counts.get('misses', 0)],
+        [contingency_counts.get('false_alarms', 0)],
+        [contingency_counts.get('correct_negatives', 0)]
+    )
+    return {key: values.item() for key, values in scores.items()}
+
+
+def match_nearest(obs_lat, obs_lon, obs_time_s, fc_lat, fc_lon, fc_time_s, dt_max_s, d_max_km):
+    """
+    Nearest forecast for each observation, fusing the time window, haversine and min.
+
+    Coordinates are in radians and times in int64 seconds; fc_time_s must be
+    sorted. Compiled with numba (parallel over observations, releasing the
+    GIL) when it is installed.
+
+    Returns:
+        (best_idx, best_dist) arrays; best_idx is -1 where no forecast is
+        within d_max_km and dt_max_s
+    """
+    n = obs_lat.shape[0]
+    best_idx = np.full(n, -1, dtype=np.int64)
+    best_dist = np.full(n, np.inf)
+
+    for i in prange(n):
+        lo = np.searchsorted(fc_time_s, obs_time_s[i] - dt_max_s, side='left')
+        hi = np.searchsorted(fc_time_s, obs_time_s[i] + dt_max_s, side='right')
+
+        for j in range(lo, hi):
+            distance = _haversine_km(obs_lat[i], obs_lon[i], fc_lat[j], fc_lon[j])
+            if distance <= d_max_km and distance < best_dist[i]:
+                best_dist[i] = distance
+                best_idx[i] = j
+
+    return best_idx, best_dist
+
+
+if NUMBA_AVAILABLE:
+    match_nearest = njit(parallel=True, nogil=True, cache=True, fastmath=True)(match_nearest)
+
+
 class ForecastVerifier:
     """
     Main verification engine that matches forecasts to observations
@@ -268,59 +773,227 @@ class ForecastVerifier:
 
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    # Query forecasts near observation
+                    # Nearest forecast within the thresholds, answered by the
+                    # GiST index on geog (scripts/update_forecast_geog_schema.sql)
                     query = """
+                        WITH obs AS (
+                            SELECT ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography AS geog
+                        )
                         SELECT
-                            id, value, location_lat, location_lon,
-                            valid_time, init_time, lead_time_hours
-                        FROM model_forecasts
-                        WHERE model_name = %s
-                          AND variable = %s
-                          AND valid_time BETWEEN %s AND %s
-                        ORDER BY valid_time
+                            f.id, f.value, f.location_lat, f.location_lon,
+                            f.valid_time, f.init_time, f.lead_time_hours,
+                            ST_Distance(f.geog, obs.geog, false) / 1000.0 AS distance_km
+                        FROM model_forecasts f, obs
+                        WHERE f.model_name = %s
+                          AND f.variable = %s
+                          AND f.valid_time BETWEEN %s AND %s
+                          AND ST_DWithin(f.geog, obs.geog, %s * 1000.0, false)
+                        ORDER BY f.geog <-> obs.geog, f.valid_time
+                        LIMIT 1
                     """
 
-                    cur.execute(query, (model_name, variable, time_min, time_max))
-                    forecasts = cur.fetchall()
+                    cur.execute(query, (obs_lon, obs_lat, model_name, variable,
+                                        time_min, time_max, self.spatial_threshold_km))
+                    row = cur.fetchone()
 
-                    if not forecasts:
+                    if row is None:
                         return None
 
-                    # Find nearest by distance
-                    best_match = None
-                    best_distance = float('inf')
-
-                    for fc_id, value, fc_lat, fc_lon, valid_time, init_time, lead_time in forecasts:
-                        distance = haversine_distance(obs_lat, obs_lon, fc_lat, fc_lon)
-
-                        if distance <= self.spatial_threshold_km and distance < best_distance:
-                            time_diff = abs((obs_time - valid_time).total_seconds() / 3600.0)
-                            best_distance = distance
-                            best_match = {
-                                'id': fc_id,
-                                'value': value,
-                                'lat': fc_lat,
-                                'lon': fc_lon,
-                                'obs_lat': obs_lat,
-                                'obs_lon': obs_lon,
-                                'valid_time': valid_time,
-                                'init_time': init_time,
-                                'lead_time_hours': lead_time,
-                                'distance_km': distance,
-                                'time_diff_hours': time_diff
-                            }
-
-                    return best_match
+                    fc_id, value, fc_lat, fc_lon, valid_time, init_time, lead_time, distance = row
+                    return {
+                        'id': fc_id,
+                        'value': value,
+                        'lat': fc_lat,
+                        'lon': fc_lon,
+                        'obs_lat': obs_lat,
+                        'obs_lon': obs_lon,
+                        'valid_time': valid_time,
+                        'init_time': init_time,
+                        'lead_time_hours': lead_time,
+                        'distance_km': distance,
+                        'time_diff_hours': abs((obs_time - valid_time).total_seconds() / 3600.0)
+                    }
 
         except Exception as e:
             logger.error(f"Error finding nearest forecast: {e}")
             return None
 
+    def _fetch_forecasts(self, conn, model_name: str, variable: str,
+                         time_min: datetime, time_max: datetime) -> List[Tuple]:
+        """Fetch all forecasts for a model/variable valid within [time_min, time_max] on conn."""
+        with conn.cursor() as cur:
+            query = """
+                SELECT
+                    id, value, location_lat, location_lon,
+                    valid_time, init_time, lead_time_hours
+                FROM model_forecasts
+                WHERE model_name = %s
+                  AND variable = %s
+                  AND valid_time BETWEEN %s AND %s
+                ORDER BY valid_time
+            """
+
+            cur.execute(query, (model_name, variable, time_min, time_max))
+            return cur.fetchall()
+
+    def _build_forecast_arrays(self, forecasts: List[Tuple]) -> Dict[str, Any]:
+        """
+        Convert fetched forecast rows into a struct-of-arrays layout.
+
+        Coordinates are converted to radians once here rather than per
+        match, and held as MATCH_DTYPE to halve the bytes the haversine
+        passes read; values and degrees stay float64 for the stored
+        results. All columns are sorted by valid time (stable, so ties
+        keep row order), which lets a time window be found with a binary
+        search over 'time_i8' and makes each valid time a contiguous
+        slice. When scikit-learn is available each slice gets a BallTree
+        on (lat, lon) radians with the haversine metric.
+
+        Returns:
+            Dict of column arrays ('id', 'value', 'lat', 'lon', 'lat_rad',
+            'lon_rad', 'valid_time', 'time_i8', ...) plus per-valid-time
+            'group_times' and 'group_bounds', and 'trees' (None without
+            scikit-learn)
+        """
+        try:
+            from sklearn.neighbors import BallTree
+        except ImportError:
+            BallTree = None
+
+        ids, values, lats, lons, valid_times, init_times, lead_times = (
+            zip(*forecasts) if forecasts else ((),) * 7
+        )
+
+        fc = {
+            'id': np.asarray(ids, dtype=np.int64),
+            'value': np.asarray(values, dtype=np.float64),
+            'lat': np.asarray(lats, dtype=np.float64),
+            'lon': np.asarray(lons, dtype=np.float64),
+            'valid_time': _to_datetime64(valid_times),
+            'valid_time_obj': np.asarray(valid_times, dtype=object),
+            'init_time': np.asarray(init_times, dtype=object),
+            'lead_time_hours': np.asarray(lead_times),
+        }
+        order = np.argsort(fc['valid_time'], kind='stable')
+        fc = {name: column[order] for name, column in fc.items()}
+        fc['lat_rad'] = np.radians(fc['lat'].astype(MATCH_DTYPE))
+        fc['lon_rad'] = np.radians(fc['lon'].astype(MATCH_DTYPE))
+        fc['time_i8'] = fc['valid_time'].view(np.int64)
+
+        group_times, starts = np.unique(fc['valid_time'], return_index=True)
+        ends = np.append(starts[1:], len(fc['id']))
+        fc['group_times'] = group_times
+        fc['group_bounds'] = list(zip(starts.tolist(), ends.tolist()))
+        # BallTree works in float64 regardless, so it gets full-precision radians
+        fc['trees'] = [
+            BallTree(np.radians(np.column_stack([fc['lat'][lo:hi], fc['lon'][lo:hi]])), metric='haversine')
+            for lo, hi in fc['group_bounds']
+        ] if BallTree is not None else None
+        return fc
+
+    def _match_obs(self, fc: Dict[str, Any], obs_lat: float, obs_lon: float,
+                   obs_time: np.datetime64) -> Tuple[int, float]:
+        """
+        Find the nearest forecast in `fc` within the spatial and temporal thresholds.
+
+        Same semantics as find_nearest_forecast: the closest forecast valid
+        within +/- temporal_threshold_hours wins, with ties going to the
+        earliest valid time. obs_time is a datetime64[s], as produced by
+        _to_datetime64, so time arithmetic stays in int64 seconds.
+
+        Returns:
+            (index into fc, distance in km), or (-1, inf) if nothing matches
+        """
+        window_s = int(self.temporal_threshold_hours * 3600)
+        obs_s = int(obs_time.astype(np.int64))
+        obs_rad = np.radians([obs_lat, obs_lon])
+
+        if fc['trees'] is None:
+            # One vectorized haversine over the whole time window; argmin
+            # returns the first minimum, i.e. the earliest valid time
+            lo = np.searchsorted(fc['time_i8'], obs_s - window_s, side='left')
+            hi = np.searchsorted(fc['time_i8'], obs_s + window_s, side='right')
+            if lo == hi:
+                return -1, float('inf')
+
+            obs_lat_rad, obs_lon_rad = obs_rad.astype(MATCH_DTYPE)
+            distances = _haversine_rad(obs_lat_rad, obs_lon_rad, fc['lat_rad'][lo:hi], fc['lon_rad'][lo:hi])
+            nearest = int(np.argmin(distances))
+            distance = float(distances[nearest])
+            if distance > self.spatial_threshold_km:
+                return -1, float('inf')
+            return lo + nearest, distance
+
+        window = np.timedelta64(window_s, 's')
+        lo = np.searchsorted(fc['group_times'], obs_time - window, side='left')
+        hi = np.searchsorted(fc['group_times'], obs_time + window, side='right')
+
+        best = -1
+        best_distance = float('inf')
+
+        for g in range(lo, hi):
+            dist, idx = fc['trees'][g].query(obs_rad.reshape(1, 2), k=1)
+            distance = float(dist[0][0]) * EARTH_RADIUS_KM
+
+            if distance <= self.spatial_threshold_km and distance < best_distance:
+                best_distance = distance
+                best = fc['group_bounds'][g][0] + int(idx[0][0])
+
+        return best, best_distance
+
+    def _match_observations(self, fc: Dict[str, Any], obs_lats: np.ndarray, obs_lons: np.ndarray,
+                            obs_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Match a batch of observations of one variable against `fc`.
+
+        Uses the compiled match_nearest kernel when numba is installed,
+        otherwise _match_obs per observation.
+
+        Returns:
+            (indexes into fc, distances in km); -1 where nothing matches
+        """
+        if NUMBA_AVAILABLE:
+            return match_nearest(
+                np.radians(obs_lats).astype(MATCH_DTYPE), np.radians(obs_lons).astype(MATCH_DTYPE),
+                obs_times.view(np.int64),
+                fc['lat_rad'], fc['lon_rad'], fc['time_i8'],
+                int(self.temporal_threshold_hours * 3600), float(self.spatial_threshold_km)
+            )
+
+        best_idx = np.full(len(obs_lats), -1, dtype=np.int64)
+        best_dist = np.full(len(obs_lats), np.inf)
+        for i, (obs_lat, obs_lon, obs_time) in enumerate(zip(obs_lats, obs_lons, obs_times)):
+            best_idx[i], best_dist[i] = self._match_obs(fc, obs_lat, obs_lon, obs_time)
+        return best_idx, best_dist
+
+    @staticmethod
+    def _forecast_match(fc: Dict[str, Any], index: int, distance: float,
+                        obs_lat: float, obs_lon: float, obs_time: np.datetime64) -> Dict:
+        """Build the find_nearest_forecast-style result for forecast `index` of `fc`."""
+        return {
+            'id': int(fc['id'][index]),
+            'value': float(fc['value'][index]),
+            'lat': float(fc['lat'][index]),
+            'lon': float(fc['lon'][index]),
+            'obs_lat': obs_lat,
+            'obs_lon': obs_lon,
+            'valid_time': fc['valid_time_obj'][index],
+            'init_time': fc['init_time'][index],
+            'lead_time_hours': fc['lead_time_hours'][index].item(),
+            'distance_km': float(distance),
+            'time_diff_hours': abs(int((obs_time - fc['valid_time'][index]).astype(np.int64))) / 3600.0
+        }
+
     def verify_forecasts(self, model_name: str, start_time: datetime, end_time: datetime,
                         variable: Optional[str] = None, dry_run: bool = False) -> Dict[str, Any]:
         """
         Verify all forecasts for a model within a time range.
 
+        Observations are streamed from a server-side cursor and verified in
+        batches of OBS_BATCH_SIZE, so memory stays bounded on long periods.
+        Forecasts are fetched and each batch's results stored on the same
+        connection as the stream, so a run holds a single pool connection.
+
         Args:
             model_name: Model to verify
             start_time: Start of verification period
@@ -333,9 +1006,24 @@ class ForecastVerifier:
         """
         logger.info(f"Starting verification for {model_name}: {start_time} to {end_time}")
 
-        # Query observations
+        observations_seen = 0
+        pairs_verified = 0
+        stats_by_variable = {}
+        threshold_stats = {}
+        qc_counts = defaultdict(Counter)
+
+        # Forecasts for the whole period are fetched once per variable and
+        # laid out as column arrays, instead of one query + linear scan per observation
+        window = timedelta(hours=self.temporal_threshold_hours)
+        forecast_range = (start_time - window, end_time + window)
+        forecast_arrays = {}
+
+        # Stream observations. WITH HOLD keeps the cursor open across the
+        # per-batch commits of _store_verification_results; committing right
+        # after the declare means a failed batch's rollback cannot drop it
         with get_db_connection() as conn:
-            with conn.cursor() as cur:
+            with conn.cursor(name='obs_stream', withhold=True) as cur:
+                cur.itersize = OBS_BATCH_SIZE
                 query = """
                     SELECT
                         id, station_id, obs_time, location_lat, location_lon,
@@ -352,132 +1040,338 @@ class ForecastVerifier:
                 query += " ORDER BY obs_time"
 
                 cur.execute(query, params)
-                observations = cur.fetchall()
+                conn.commit()
+                while True:
+                    observations = cur.fetchmany(OBS_BATCH_SIZE)
+                    if not observations:
+                        break
 
-        logger.info(f"Found {len(observations)} observations to verify")
+                    observations_seen += len(observations)
+                    pairs_verified += self._verify_batch(
+                        conn, model_name, observations, forecast_arrays, forecast_range,
+                        stats_by_variable, threshold_stats, qc_counts, dry_run
+                    )
 
+        logger.info(f"Processed {observations_seen} observations")
+        log_qc_summary(qc_counts)
+
+        # Calculate summary statistics
+        summary = self._calculate_summary(stats_by_variable, threshold_stats)
+        summary['pairs_verified'] = pairs_verified
+
+        logger.success(f"Verified {pairs_verified} forecast-observation pairs for {model_name}")
+
+        return summary
+
+    def _verify_batch(self, conn, model_name: str, observations: List[Tuple], forecast_arrays: Dict[str, Dict],
+                      forecast_range: Tuple[datetime, datetime], stats_by_variable: Dict,
+                      threshold_stats: Dict, qc_counts: Dict[str, Counter], dry_run: bool) -> int:
+        """
+        Verify one batch of observation rows, accumulating into the run's stats.
+
+        Forecast arrays are built on first use of each variable and cached in
+        forecast_arrays for later batches. The batch's results are stored
+        before returning unless dry_run is set. Both use conn, the connection
+        the observations are streamed on.
+
+        Returns:
+            Number of forecast-observation pairs verified in this batch
+        """
         pairs_verified = 0
-        stats_by_variable = {}
-        threshold_stats = {}
+        pending_results = []
+        matched_values = {}
+
+        # QC check, applied as a mask over the whole batch
+        qc_mask = quality_check_batch(
+            [obs[6] for obs in observations], [obs[5] for obs in observations], qc_counts
+        )
+
+        observations = list(compress(observations, qc_mask))
+        obs_times = _to_datetime64([obs[2] for obs in observations])
+        obs_lats = np.array([obs[3] for obs in observations], dtype=np.float64)
+        obs_lons = np.array([obs[4] for obs in observations], dtype=np.float64)
+        obs_vars = np.array([obs[5] for obs in observations], dtype=object)
+
+        # Find matching forecasts, one batch per variable
+        match_idx = np.full(len(observations), -1, dtype=np.int64)
+        match_dist = np.full(len(observations), np.inf)
+        for obs_var in dict.fromkeys(obs_vars):
+            if obs_var not in forecast_arrays:
+                forecast_arrays[obs_var] = self._build_forecast_arrays(
+                    self._fetch_forecasts(conn, model_name, obs_var, *forecast_range)
+                )
+            sel = np.flatnonzero(obs_vars == obs_var)
+            match_idx[sel], match_dist[sel] = self._match_observations(
+                forecast_arrays[obs_var], obs_lats[sel], obs_lons[sel], obs_times[sel]
+            )
 
-        for obs in observations:
+        for i, obs in enumerate(observations):
             obs_id, station_id, obs_time, obs_lat, obs_lon, obs_var, obs_value, obs_units, obs_type = obs
 
-            # QC check
-            if not quality_check_observation(obs_value, obs_var):
+            if match_idx[i] < 0:
                 continue
 
-            # Find matching forecast
-            forecast = self.find_nearest_forecast(obs_lat, obs_lon, obs_time, obs_var, model_name)
+            forecast = self._forecast_match(
+                forecast_arrays[obs_var], match_idx[i], match_dist[i], obs_lat, obs_lon, obs_times[i]
+            )
 
-            if not forecast:
-                continue
+            # Matched values; metrics are computed per variable after the loop
+            forecast_values, observed_values = matched_values.setdefault(obs_var, ([], []))
+            pair_index = len(forecast_values)
+            forecast_values.append(forecast['value'])
+            observed_values.append(obs_value)
 
-            # Calculate statistical metrics
-            stat_metrics = calculate_statistical_metrics(forecast['value'], obs_value)
+            # Buffer results; they are stored together after the loop
+            if not dry_run:
+                pending_results.append((obs_var, pair_index, forecast, obs_value))
 
-            # Get thresholds for this variable
-            var_config = VARIABLE_MAPPINGS.get(obs_var, {})
-            thresholds = var_config.get('default_thresholds', [])
+            pairs_verified += 1
 
-            # Calculate threshold metrics
-            threshold_results = calculate_threshold_metrics(
-                forecast['value'], obs_value, thresholds
-            ) if thresholds else {}
+        # Statistical and threshold metrics for all pairs of a variable at once
+        pair_metrics = {}
+        threshold_outcomes = {}
+        for var, (forecast_values, observed_values) in matched_values.items():
+            metrics = calculate_statistical_metrics_batch(forecast_values, observed_values)
+            pair_metrics[var] = metrics
+
+            # Aggregate stats as running sums
+            if var not in stats_by_variable:
+                stats_by_variable[var] = {'n': 0, 'sum_e': 0.0, 'sum_ae': 0.0, 'sum_se': 0.0}
+
+            stats = stats_by_variable[var]
+            stats['n'] += len(forecast_values)
+            stats['sum_e'] += float(metrics.error.sum())
+            stats['sum_ae'] += float(metrics.absolute_error.sum())
+            stats['sum_se'] += float(metrics.squared_error.sum())
+
+            thresholds = DEFAULT_THRESHOLDS.get(var)
+            if thresholds is None or thresholds.size == 0:
+                continue
 
-            # Store results
-            if not dry_run:
-                verification_id = self._store_verification_result(
-                    model_name, obs_var, forecast, obs_value,
-                    stat_metrics, threshold_results
-                )
+            outcomes = calculate_threshold_outcomes(forecast_values, observed_values, thresholds)
+            threshold_outcomes[var] = (thresholds.tolist(), outcomes)
+            for k, threshold in enumerate(threshold_outcomes[var][0]):
+                key = (var, threshold)
+                threshold_stats[key] = threshold_stats.get(key, 0) + outcomes['counts'][k]
 
-            # Aggregate stats
-            if obs_var not in stats_by_variable:
-                stats_by_variable[obs_var] = {
-                    'errors': [],
-                    'absolute_errors': [],
-                    'squared_errors': [],
-                    'pairs': 0
-                }
-
-            stats_by_variable[obs_var]['errors'].append(stat_metrics['error'])
-            stats_by_variable[obs_var]['absolute_errors'].append(stat_metrics['absolute_error'])
-            stats_by_variable[obs_var]['squared_errors'].append(stat_metrics['squared_error'])
-            stats_by_variable[obs_var]['pairs'] += 1
-
-            # Aggregate threshold stats
-            for threshold, result in threshold_results.items():
-                key = (obs_var, threshold)
-                if key not in threshold_stats:
-                    threshold_stats[key] = {'hits': 0, 'misses': 0, 'false_alarms': 0, 'correct_negatives': 0}
-                threshold_stats[key][result['outcome'] + 's'] = threshold_stats[key].get(result['outcome'] + 's', 0) + 1
+        if pending_results:
+            self._store_verification_results(conn, model_name, pending_results, pair_metrics, threshold_outcomes)
 
-            pairs_verified += 1
+        return pairs_verified
 
-        # Calculate summary statistics
-        summary = self._calculate_summary(stats_by_variable, threshold_stats)
-        summary['pairs_verified'] = pairs_verified
+    def verify_in_database(self, model_name: str, start_time: datetime, end_time: datetime,
+                           variable: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Compute the verify_forecasts summary entirely in PostgreSQL, without storing results.
 
-        logger.success(f"Verified {pairs_verified} forecast-observation pairs for {model_name}")
+        QC, nearest-forecast matching (a LATERAL PostGIS KNN lookup per
+        observation) and the MAE/RMSE/bias and contingency reductions all
+        run server-side, so only the per-variable and per-threshold
+        aggregates cross the wire. Requires the model_forecasts.geog column
+        (scripts/update_forecast_geog_schema.sql).
 
-        return summary
+        Args:
+            model_name: Model to verify
+            start_time: Start of verification period
+            end_time: End of verification period
+            variable: Specific variable (None = all)
+
+        Returns:
+            Verification statistics, in the same shape as verify_forecasts
+        """
+        logger.info(f"Starting in-database verification for {model_name}: {start_time} to {end_time}")
+
+        summary = {'statistical_summary': {}, 'decision_summary': {}, 'pairs_verified': 0}
+        qc_vars = list(REASONABLE_RANGES)
+        threshold_pairs = [
+            (var, threshold)
+            for var, config in VARIABLE_MAPPINGS.items()
+            for threshold in config.get('default_thresholds', [])
+        ]
+
+        match_query = """
+            CREATE TEMP TABLE verification_matched ON COMMIT DROP AS
+            SELECT o.variable, f.value AS fc, o.value AS obs
+            FROM observations o
+            LEFT JOIN unnest(%s::text[], %s::float8[], %s::float8[]) AS qc(variable, min_val, max_val)
+              ON qc.variable = o.variable
+            CROSS JOIN LATERAL (
+                SELECT m.value
+                FROM model_forecasts m
+                WHERE m.model_name = %s
+                  AND m.variable = o.variable
+                  AND m.valid_time BETWEEN o.obs_time - %s * INTERVAL '1 hour'
+                                       AND o.obs_time + %s * INTERVAL '1 hour'
+                  AND ST_DWithin(m.geog, ST_SetSRID(ST_MakePoint(o.location_lon, o.location_lat), 4326)::geography,
+                                 %s * 1000.0, false)
+                ORDER BY m.geog <-> ST_SetSRID(ST_MakePoint(o.location_lon, o.location_lat), 4326)::geography,
+                         m.valid_time
+                LIMIT 1
+            ) f
+            WHERE o.obs_time BETWEEN %s AND %s
+              AND o.value <> 'NaN'
+              AND o.value NOT IN (999.9, -999.9)
+              AND (qc.variable IS NULL OR o.value BETWEEN qc.min_val AND qc.max_val)
+        """
+        params = [
+            qc_vars,
+            [REASONABLE_RANGES[var][0] for var in qc_vars],
+            [REASONABLE_RANGES[var][1] for var in qc_vars],
+            model_name,
+            self.temporal_threshold_hours, self.temporal_threshold_hours,
+            self.spatial_threshold_km,
+            start_time, end_time
+        ]
+
+        if variable:
+            match_query += " AND o.variable = %s"
+            params.append(variable)
 
-    def _store_verification_result(self, model_name: str, variable: str, forecast: Dict,
-                                   obs_value: float, stat_metrics: Dict,
-                                   threshold_results: Dict) -> int:
-        """Store verification result in database."""
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    # Insert verification_scores
-                    insert_query = """
-                        INSERT INTO verification_scores
-                        (model_name, variable, valid_time, lead_time_hours,
-                         location_lat, location_lon,
-                         forecast_value, observed_value,
-                         forecast_lat, forecast_lon, distance_km, time_diff_hours,
-                         error, absolute_error, squared_error,
-                         forecast_init_time, forecast_valid_time)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING id
-                    """
+                    cur.execute(match_query, params)
+
+                    cur.execute("""
+                        SELECT variable, COUNT(*), AVG(ABS(fc - obs)), SQRT(AVG((fc - obs) ^ 2)), AVG(fc - obs)
+                        FROM verification_matched
+                        GROUP BY variable
+                    """)
+                    for var, pairs, mae, rmse, bias in cur.fetchall():
+                        summary['statistical_summary'][var] = {
+                            'mae': mae,
+                            'rmse': rmse,
+                            'bias': bias,
+                            'pairs': pairs
+                        }
+                        summary['pairs_verified'] += pairs
+
+                    cur.execute("""
+                        SELECT m.variable, t.threshold,
+                            COUNT(*) FILTER (WHERE m.fc > t.threshold AND m.obs > t.threshold) AS hits,
+                            COUNT(*) FILTER (WHERE m.fc <= t.threshold AND m.obs > t.threshold) AS misses,
+                            COUNT(*) FILTER (WHERE m.fc > t.threshold AND m.obs <= t.threshold) AS false_alarms,
+                            COUNT(*) FILTER (WHERE m.fc <= t.threshold AND m.obs <= t.threshold) AS correct_negatives
+                        FROM verification_matched m
+                        JOIN unnest(%s::text[], %s::float8[]) AS t(variable, threshold)
+                          ON t.variable = m.variable
+                        GROUP BY m.variable, t.threshold
+                    """, ([var for var, _ in threshold_pairs], [threshold for _, threshold in threshold_pairs]))
+                    counts_by_key = {
+                        (var, threshold): counts
+                        for var, threshold, *counts in cur.fetchall()
+                    }
 
-                    cur.execute(insert_query, (
-                        model_name, variable,
-                        forecast['valid_time'], forecast['lead_time_hours'],
-                        forecast['obs_lat'], forecast['obs_lon'],
-                        forecast['value'], obs_value,
-                        forecast['lat'], forecast['lon'],
-                        forecast['distance_km'], forecast['time_diff_hours'],
-                        stat_metrics['error'], stat_metrics['absolute_error'], stat_metrics['squared_error'],
-                        forecast['init_time'], forecast['valid_time']
-                    ))
-
-                    verification_id = cur.fetchone()[0]
-
-                    # Insert threshold_verification results
-                    if threshold_results:
-                        threshold_insert = """
-                            INSERT INTO threshold_verification
-                            (verification_score_id, threshold_value, threshold_operator,
-                             forecast_exceeds, observed_exceeds, outcome)
-                            VALUES (%s, %s, %s, %s, %s, %s)
-                        """
-
-                        threshold_data = [
-                            (verification_id, threshold, result['operator'],
-                             result['forecast_exceeds'], result['observed_exceeds'], result['outcome'])
-                            for threshold, result in threshold_results.items()
-                        ]
-
-                        cur.executemany(threshold_insert, threshold_data)
+        except Exception as e:
+            logger.error(f"Failed to verify {model_name} in database: {e}")
+            return summary
 
-                    conn.commit()
-                    return verification_id
+        # Keys use the configured threshold values, as verify_forecasts does
+        for var, threshold in threshold_pairs:
+            counts = counts_by_key.get((var, float(threshold)))
+            if counts is None:
+                continue
+            hits, misses, false_alarms, correct_negatives = counts
+            summary['decision_summary'][f"{var}_threshold_{threshold}"] = calculate_decision_scores({
+                'hits': hits,
+                'misses': misses,
+                'false_alarms': false_alarms,
+                'correct_negatives': correct_negatives
+            })
+
+        logger.success(f"Verified {summary['pairs_verified']} forecast-observation pairs for {model_name} in database")
+
+        return summary
+
+    def _store_verification_results(self, conn, model_name: str, results: List[Tuple],
+                                    pair_metrics: Dict[str, StatMetrics],
+                                    threshold_outcomes: Dict[str, Tuple]) -> int:
+        """
+        Store one batch of verification results in a single transaction.
+
+        verify_forecasts calls this once per OBS_BATCH_SIZE batch and each
+        call commits on its own, so a run that fails part way leaves the
+        earlier batches' results committed.
+
+        Args:
+            conn: Open database connection; the results are committed on it,
+                or rolled back on failure
+            model_name: Model that was verified
+            results: (variable, pair_index, forecast, obs_value) tuples, one per
+                verified pair
+            pair_metrics: {variable: calculate_statistical_metrics_batch result},
+                indexed by pair_index
+            threshold_outcomes: {variable: (thresholds, calculate_threshold_outcomes result)},
+                indexed by pair_index
+
+        Returns:
+            Number of verification_scores rows stored, or -1 on failure
+        """
+        try:
+            with conn.cursor() as cur:
+                # Insert verification_scores
+                insert_query = """
+                    INSERT INTO verification_scores
+                    (model_name, variable, valid_time, lead_time_hours,
+                     location_lat, location_lon,
+                     forecast_value, observed_value,
+                     forecast_lat, forecast_lon, distance_km, time_diff_hours,
+                     error, absolute_error, squared_error,
+                     forecast_init_time, forecast_valid_time)
+                    VALUES %s
+                    RETURNING id
+                """
+
+                score_rows = [
+                    (model_name, variable,
+                     forecast['valid_time'], forecast['lead_time_hours'],
+                     forecast['obs_lat'], forecast['obs_lon'],
+                     forecast['value'], obs_value,
+                     forecast['lat'], forecast['lon'],
+                     forecast['distance_km'], forecast['time_diff_hours'],
+                     float(pair_metrics[variable].error[pair_index]),
+                     float(pair_metrics[variable].absolute_error[pair_index]),
+                     float(pair_metrics[variable].squared_error[pair_index]),
+                     forecast['init_time'], forecast['valid_time'])
+                    for variable, pair_index, forecast, obs_value in results
+                ]
+
+                # RETURNING ids come back in VALUES order, one per row
+                verification_ids = [
+                    row[0] for row in execute_values(
+                        cur, insert_query, score_rows, page_size=STORE_PAGE_SIZE, fetch=True
+                    )
+                ]
+
+                # Insert threshold_verification results
+                threshold_insert = """
+                    INSERT INTO threshold_verification
+                    (verification_score_id, threshold_value, threshold_operator,
+                     forecast_exceeds, observed_exceeds, outcome)
+                    VALUES %s
+                """
+
+                threshold_data = []
+                for verification_id, (variable, pair_index, *_) in zip(verification_ids, results):
+                    if variable not in threshold_outcomes:
+                        continue
+                    thresholds, outcomes = threshold_outcomes[variable]
+                    forecast_exceeds = outcomes['forecast_exceeds'][pair_index].tolist()
+                    observed_exceeds = outcomes['observed_exceeds'][pair_index].tolist()
+                    for threshold, fe, oe in zip(thresholds, forecast_exceeds, observed_exceeds):
+                        threshold_data.append((
+                            verification_id, threshold, '>', fe, oe, _OUTCOMES[2 * fe + oe]
+                        ))
+
+                if threshold_data:
+                    execute_values(cur, threshold_insert, threshold_data, page_size=STORE_PAGE_SIZE)
+
+                conn.commit()
+                return len(verification_ids)
 
         except Exception as e:
-            logger.error(f"Failed to store verification result: {e}")
+            conn.rollback()
+            logger.error(f"Failed to store verification results: {e}")
             return -1
 
     def _calculate_summary(self, stats_by_variable: Dict, threshold_stats: Dict) -> Dict:
@@ -489,17 +1383,22 @@ class ForecastVerifier:
 
         # Statistical summary
         for var, stats in stats_by_variable.items():
+            n = stats['n']
             summary['statistical_summary'][var] = {
-                'mae': np.mean(stats['absolute_errors']),
-                'rmse': np.sqrt(np.mean(stats['squared_errors'])),
-                'bias': np.mean(stats['errors']),
-                'pairs': stats['pairs']
+                'mae': stats['sum_ae'] / n,
+                'rmse': np.sqrt(stats['sum_se'] / n),
+                'bias': stats['sum_e'] / n,
+                'pairs': n
             }
 
-        # Decision summary
-        for (var, threshold), counts in threshold_stats.items():
-            key = f"{var}_threshold_{threshold}"
-            summary['decision_summary'][key] = calculate_decision_scores(counts)
+        # Decision summary, scored for every (variable, threshold) cell at once
+        if threshold_stats:
+            counts = np.array(list(threshold_stats.values()), dtype=np.int64)
+            scores = calculate_decision_scores_batch(*counts.T)
+            rows = zip(*(values.tolist() for values in scores.values()))
+            for (var, threshold), row in zip(threshold_stats, rows):
+                key = f"{var}_threshold_{threshold}"
+                summary['decision_summary'][key] = dict(zip(scores, row))
 
         return summary
 
@@ -518,9 +1417,33 @@ class ForecastVerifier:
         """
         try:
             with get_db_connection() as conn:
-                # Refresh materialized view
+                # Refresh materialized view if stale. Only the worker holding
+                # the transaction-level advisory lock refreshes; anyone else
+                # skips straight to reading the current view instead of
+                # waiting. last_refresh is written only after a successful
+                # refresh and commits with it, and a failed refresh rolls
+                # back (releasing the lock) so the next caller retries.
+                # CONCURRENTLY keeps the view readable meanwhile
                 with conn.cursor() as cur:
-                    cur.execute("REFRESH MATERIALIZED VIEW skill_metrics_summary")
+                    cur.execute("SELECT pg_try_advisory_xact_lock(hashtext('skill_metrics_summary'))")
+                    if cur.fetchone()[0]:
+                        cur.execute("""
+                            SELECT 1 FROM refresh_log
+                            WHERE view_name = 'skill_metrics_summary'
+                              AND last_refresh >= NOW() - %s * INTERVAL '1 minute'
+                        """, (SKILL_REFRESH_INTERVAL_MINUTES,))
+
+                        if cur.fetchone() is None:
+                            try:
+                                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY skill_metrics_summary")
+                                cur.execute("""
+                                    INSERT INTO refresh_log (view_name, last_refresh)
+                                    VALUES ('skill_metrics_summary', NOW())
+                                    ON CONFLICT (view_name) DO UPDATE SET last_refresh = EXCLUDED.last_refresh
+                                """)
+                            except Exception as e:
+                                conn.rollback()
+                                logger.warning(f"Failed to refresh skill_metrics_summary, reading stale view: {e}")
                     conn.commit()
 
                 # Query aggregated metrics
@@ -531,8 +1454,13 @@ class ForecastVerifier:
                     ORDER BY verification_date DESC, variable, lead_time_hours
                 """
 
-                df = pd.read_sql_query(query, conn, params=(model_name, lookback_days))
-                return df
+                # Read in chunks, narrowing metric columns as each arrives
+                chunks = [
+                    chunk.astype({col: np.float32 for col in SKILL_FLOAT_COLUMNS if col in chunk.columns})
+                    for chunk in pd.read_sql_query(query, conn, params=(model_name, lookback_days),
+                                                   chunksize=SKILL_READ_CHUNK_SIZE)
+                ]
+                return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
 
         except Exception as e:
             logger.error(f"Failed to aggregate skill metrics: {e}")
@@ -0,0 +1,12 @@
+"""Shared fixtures for unit tests."""
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='session')
+def random_latlon_pairs():
+    """100k random (lat1, lon1, lat2, lon2) point pairs in degrees, built once per session."""
+    rng = np.random.default_rng(42)
+    n = 100_000
+    return (rng.uniform(-90, 90, n), rng.uniform(-180, 180, n),
+            rng.uniform(-90, 90, n), rng.uniform(-180, 180, n))
@@ -7,11 +7,6 @@ functions work correctly with the actual database and file system.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-
-# Import health check functions
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 
 class TestDatabaseConnectivity:
@@ -10,41 +10,39 @@ Tests cover:
 """
 import pytest
 import numpy as np
-from datetime import datetime, timedelta, timezone
-
-# Import verification functions
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Project root is put on sys.path once per session by the root conftest.py
 from src.verification.forecast_verification import (
+    _threshold_kernel,
     haversine_distance,
+    haversine_distance_batch,
+    make_haversine_from,
     quality_check_observation,
+    quality_check_reason,
+    quality_check_batch,
     calculate_statistical_metrics,
+    calculate_statistical_metrics_batch,
     calculate_threshold_metrics,
+    calculate_threshold_outcomes,
     calculate_decision_scores,
+    calculate_decision_scores_batch,
 )
 
 
 class TestHaversineDistance:
     """Test great circle distance calculations."""
 
-    def test_same_point(self):
-        """Distance from point to itself should be zero."""
-        distance = haversine_distance(34.0, -118.0, 34.0, -118.0)
-        assert distance == pytest.approx(0.0, abs=0.01)
-
-    def test_known_distance(self):
-        """Test against known distance: LAX to JFK ~3983 km."""
-        # LAX: 33.9425° N, 118.4081° W
-        # JFK: 40.6413° N, 73.7781° W
-        distance = haversine_distance(33.9425, -118.4081, 40.6413, -73.7781)
-        assert distance == pytest.approx(3983, rel=0.05)  # Within 5%
-
-    def test_equator_distance(self):
-        """1 degree longitude at equator ≈ 111.32 km."""
-        distance = haversine_distance(0.0, 0.0, 0.0, 1.0)
-        assert distance == pytest.approx(111.32, rel=0.01)
+    @pytest.mark.parametrize("points,expected,tolerance", [
+        # Distance from point to itself should be zero
+        pytest.param((34.0, -118.0, 34.0, -118.0), 0.0, {'abs': 0.01}, id='same_point'),
+        # LAX (33.9425° N, 118.4081° W) to JFK (40.6413° N, 73.7781° W) ~3983 km, within 5%
+        pytest.param((33.9425, -118.4081, 40.6413, -73.7781), 3983, {'rel': 0.05}, id='lax_to_jfk'),
+        # 1 degree longitude at equator ≈ 111.32 km
+        pytest.param((0.0, 0.0, 0.0, 1.0), 111.32, {'rel': 0.01}, id='equator_degree'),
+    ])
+    def test_known_distance(self, points, expected, tolerance):
+        """Distances between known points."""
+        assert haversine_distance(*points) == pytest.approx(expected, **tolerance)
 
     def test_hemisphere_change(self):
         """Distance across hemisphere."""
@@ -57,53 +55,83 @@ class TestHaversineDistance:
         distance = haversine_distance(34.0, -118.0, 34.27, -118.0)
         assert distance < 50.0
 
+    def test_batch_matches_scalar(self, random_latlon_pairs):
+        """Vectorized distances should match the scalar function point by point."""
+        batch = haversine_distance_batch(*random_latlon_pairs)
+        scalar = [haversine_distance(*point) for point in zip(*random_latlon_pairs)]
 
-class TestQualityCheck:
-    """Test observation quality control."""
+        assert np.allclose(batch, scalar)
 
-    def test_valid_temperature(self):
-        """Valid temperature should pass QC."""
-        assert quality_check_observation(288.15, 'temperature_2m') is True  # 15°C
+    def test_batch_broadcasts_single_point(self):
+        """One point against many should broadcast without building repeated inputs."""
+        distances = haversine_distance_batch(0.0, 0.0, np.zeros(3), np.array([0.0, 1.0, 2.0]))
+        assert distances.shape == (3,)
+        assert distances[0] == pytest.approx(0.0, abs=0.01)
+        assert distances[1] == pytest.approx(111.32, rel=0.01)
 
-    def test_temperature_too_cold(self):
-        """Unreasonably cold temperature should fail QC."""
-        assert quality_check_observation(200.0, 'temperature_2m') is False  # -73°C
 
-    def test_temperature_too_hot(self):
-        """Unreasonably hot temperature should fail QC."""
-        assert quality_check_observation(350.0, 'temperature_2m') is False  # 77°C
+class TestBatchHaversine:
+    """Test vectorized distance kernels."""
 
-    def test_missing_value_none(self):
-        """None value should fail QC."""
-        assert quality_check_observation(None, 'temperature_2m') is False
+    def test_from_point_matches_batch(self, random_latlon_pairs):
+        """A kernel specialized to one point should match the broadcasting batch function."""
+        _, _, lats, lons = random_latlon_pairs
+        distance_from = make_haversine_from(40.6413, -73.7781)
 
-    def test_missing_value_nan(self):
-        """NaN value should fail QC."""
-        assert quality_check_observation(np.nan, 'temperature_2m') is False
+        expected = haversine_distance_batch(40.6413, -73.7781, lats, lons)
 
-    def test_missing_value_999(self):
-        """Missing value indicator 999.9 should fail QC."""
-        assert quality_check_observation(999.9, 'temperature_2m') is False
+        assert np.allclose(distance_from(lats, lons), expected)
 
-    def test_valid_mslp(self):
-        """Valid MSLP should pass QC."""
-        assert quality_check_observation(101300.0, 'mslp') is True  # 1013 hPa
+    def test_haversine_batch_fp32_within_tolerance(self, random_latlon_pairs):
+        """Single-precision distances should stay close to the float64 result."""
+        fp32_result = haversine_distance_batch(*random_latlon_pairs, dtype=np.float32)
+        fp64_result = haversine_distance_batch(*random_latlon_pairs)
 
-    def test_mslp_too_low(self):
-        """Unreasonably low pressure should fail QC."""
-        assert quality_check_observation(85000.0, 'mslp') is False  # 850 hPa
+        assert fp32_result.dtype == np.float32
+        assert np.allclose(fp32_result, fp64_result, atol=0.01)
 
-    def test_mslp_too_high(self):
-        """Unreasonably high pressure should fail QC."""
-        assert quality_check_observation(115000.0, 'mslp') is False  # 1150 hPa
 
-    def test_valid_wind_speed(self):
-        """Valid wind speed should pass QC."""
-        assert quality_check_observation(10.0, 'wind_speed_10m') is True  # 10 m/s
+class TestQualityCheck:
+    """Test observation quality control."""
 
-    def test_negative_wind_speed(self):
-        """Negative wind speed should fail QC."""
-        assert quality_check_observation(-5.0, 'wind_speed_10m') is False
+    @pytest.mark.parametrize("value,variable,expected", [
+        pytest.param(288.15, 'temperature_2m', True, id='valid_temperature'),  # 15°C
+        pytest.param(200.0, 'temperature_2m', False, id='temperature_too_cold'),  # -73°C
+        pytest.param(350.0, 'temperature_2m', False, id='temperature_too_hot'),  # 77°C
+        pytest.param(None, 'temperature_2m', False, id='missing_value_none'),
+        pytest.param(np.nan, 'temperature_2m', False, id='missing_value_nan'),
+        pytest.param(999.9, 'temperature_2m', False, id='missing_value_999'),
+        pytest.param(101300.0, 'mslp', True, id='valid_mslp'),  # 1013 hPa
+        pytest.param(85000.0, 'mslp', False, id='mslp_too_low'),  # 850 hPa
+        pytest.param(115000.0, 'mslp', False, id='mslp_too_high'),  # 1150 hPa
+        pytest.param(10.0, 'wind_speed_10m', True, id='valid_wind_speed'),  # 10 m/s
+        pytest.param(-5.0, 'wind_speed_10m', False, id='negative_wind_speed'),
+    ])
+    def test_qc(self, value, variable, expected):
+        """Observations outside physical ranges or flagged missing should fail QC."""
+        assert quality_check_observation(value, variable) is expected
+
+    def test_batch_matches_scalar(self):
+        """Batch QC mask should agree with the per-observation check."""
+        values = [288.15, 200.0, None, np.nan, 999.9, 101325.0, 85000.0, 10.0, -5.0, 42.0]
+        variables = ['temperature_2m', 'temperature_2m', 'temperature_2m', 'mslp', 'mslp',
+                     'mslp', 'mslp', 'wind_speed_10m', 'wind_speed_10m', 'precipitation']
+
+        mask = quality_check_batch(values, variables)
+
+        assert mask.tolist() == [quality_check_observation(v, var) for v, var in zip(values, variables)]
+
+    def test_failure_reasons(self):
+        """QC should say why an observation was rejected."""
+        assert quality_check_reason(288.15, 'temperature_2m') is None
+        assert quality_check_reason(-999.9, 'temperature_2m') == 'missing'
+        assert quality_check_reason(85000.0, 'mslp') == 'out_of_range'
+
+    def test_batch_single_variable(self):
+        """A whole timeseries of one variable can be checked with a single name."""
+        values = np.array([288.15, np.nan, 999.9, 350.0, 250.0])
+        mask = quality_check_batch(values, 'temperature_2m')
+        assert mask.tolist() == [True, False, False, False, True]
 
 
 class TestStatisticalMetrics:
@@ -137,57 +165,91 @@ class TestStatisticalMetrics:
         assert metrics['absolute_error'] == 1000.0
         assert metrics['squared_error'] == 1000000.0
 
+    def test_attribute_access(self):
+        """Metrics are also available as attributes."""
+        metrics = calculate_statistical_metrics(101500.0, 101300.0)
+        assert metrics.error == metrics['error'] == 200.0
+        assert metrics.squared_error == 40000.0
 
-class TestThresholdMetrics:
-    """Test threshold-based decision metrics."""
+    def test_stats_lru_cache_hit(self):
+        """Repeated pairs should return the cached metrics object."""
+        first = calculate_statistical_metrics(101234.5, 101200.25)
+        assert calculate_statistical_metrics(101234.5, 101200.25) is first
 
-    def test_hit(self):
-        """Both forecast and observation exceed threshold = HIT."""
-        result = calculate_threshold_metrics(
-            forecast_value=101500.0,
-            observed_value=101600.0,
-            thresholds=[101000.0],
-            operator='>'
-        )
-        assert result[101000.0]['outcome'] == 'hit'
-        assert result[101000.0]['forecast_exceeds'] is True
-        assert result[101000.0]['observed_exceeds'] is True
+    def test_array_inputs_bypass_cache(self):
+        """Unhashable inputs such as arrays are computed without the cache."""
+        metrics = calculate_statistical_metrics(np.array([101500.0, 10.0]), np.array([101300.0, 12.5]))
 
-    def test_miss(self):
-        """Forecast doesn't exceed but observation does = MISS (worst)."""
-        result = calculate_threshold_metrics(
-            forecast_value=100900.0,
-            observed_value=101100.0,
-            thresholds=[101000.0],
-            operator='>'
-        )
-        assert result[101000.0]['outcome'] == 'miss'
-        assert result[101000.0]['forecast_exceeds'] is False
-        assert result[101000.0]['observed_exceeds'] is True
+        np.testing.assert_allclose(metrics.error, [200.0, -2.5])
+        np.testing.assert_allclose(metrics.absolute_error, [200.0, 2.5])
+        np.testing.assert_allclose(metrics.squared_error, [40000.0, 6.25])
 
-    def test_false_alarm(self):
-        """Forecast exceeds but observation doesn't = FALSE ALARM (costly)."""
-        result = calculate_threshold_metrics(
-            forecast_value=101100.0,
-            observed_value=100900.0,
-            thresholds=[101000.0],
-            operator='>'
-        )
-        assert result[101000.0]['outcome'] == 'false_alarm'
-        assert result[101000.0]['forecast_exceeds'] is True
-        assert result[101000.0]['observed_exceeds'] is False
+    def test_metrics_are_immutable(self):
+        """Metrics objects are frozen and carry no per-instance __dict__."""
+        metrics = calculate_statistical_metrics(101500.0, 101300.0)
+        assert not hasattr(metrics, '__dict__')
+        with pytest.raises(AttributeError):
+            metrics.error = 0.0
 
-    def test_correct_negative(self):
-        """Neither exceeds threshold = CORRECT NEGATIVE."""
+    def test_mapping_access(self):
+        """Metrics support membership tests and dict-style lookups by field name."""
+        metrics = calculate_statistical_metrics(101500.0, 101300.0)
+
+        assert 'error' in metrics
+        assert 'bias' not in metrics
+        assert metrics.get('bias') is None
+        assert list(metrics.keys()) == ['error', 'absolute_error', 'squared_error']
+        assert dict(metrics)['squared_error'] == 40000.0
+
+    def test_missing_key_raises_key_error(self):
+        """Unknown names raise KeyError rather than AttributeError."""
+        metrics = calculate_statistical_metrics(101500.0, 101300.0)
+
+        with pytest.raises(KeyError):
+            metrics['bias']
+        with pytest.raises(KeyError):
+            metrics['__len__']
+
+    def test_batch_matches_scalar(self):
+        """Batch metrics should match the per-pair values."""
+        forecasts = [273.15, 101500.0, 10.0]
+        observed = [273.15, 101300.0, 12.5]
+
+        batch = calculate_statistical_metrics_batch(forecasts, observed)
+
+        for i, (fc, obs) in enumerate(zip(forecasts, observed)):
+            metrics = calculate_statistical_metrics(fc, obs)
+            assert batch.error[i] == pytest.approx(metrics.error)
+            assert batch.absolute_error[i] == pytest.approx(metrics.absolute_error)
+            assert batch.squared_error[i] == pytest.approx(metrics.squared_error)
+
+
+class TestThresholdMetrics:
+    """Test threshold-based decision metrics."""
+
+    @pytest.mark.parametrize("forecast,observed,operator,outcome,forecast_exceeds,observed_exceeds", [
+        # Both forecast and observation exceed threshold = HIT
+        pytest.param(101500.0, 101600.0, '>', 'hit', True, True, id='hit'),
+        # Forecast doesn't exceed but observation does = MISS (worst)
+        pytest.param(100900.0, 101100.0, '>', 'miss', False, True, id='miss'),
+        # Forecast exceeds but observation doesn't = FALSE ALARM (costly)
+        pytest.param(101100.0, 100900.0, '>', 'false_alarm', True, False, id='false_alarm'),
+        # Neither exceeds threshold = CORRECT NEGATIVE
+        pytest.param(100800.0, 100900.0, '>', 'correct_negative', False, False, id='correct_negative'),
+        # Less-than operator (e.g., low pressure): both are below threshold
+        pytest.param(100500.0, 100400.0, '<', 'hit', True, True, id='less_than_operator'),
+    ])
+    def test_outcome(self, forecast, observed, operator, outcome, forecast_exceeds, observed_exceeds):
+        """Contingency outcome for a single forecast/observation pair."""
         result = calculate_threshold_metrics(
-            forecast_value=100800.0,
-            observed_value=100900.0,
+            forecast_value=forecast,
+            observed_value=observed,
             thresholds=[101000.0],
-            operator='>'
+            operator=operator
         )
-        assert result[101000.0]['outcome'] == 'correct_negative'
-        assert result[101000.0]['forecast_exceeds'] is False
-        assert result[101000.0]['observed_exceeds'] is False
+        assert result[101000.0]['outcome'] == outcome
+        assert result[101000.0]['forecast_exceeds'] is forecast_exceeds
+        assert result[101000.0]['observed_exceeds'] is observed_exceeds
 
     def test_multiple_thresholds(self):
         """Test with multiple thresholds."""
@@ -204,18 +266,62 @@ class TestThresholdMetrics:
         # So neither exceeds threshold = correct_negative
         assert result[102000.0]['outcome'] == 'correct_negative'
 
-    def test_less_than_operator(self):
-        """Test with less-than operator (e.g., low pressure)."""
-        result = calculate_threshold_metrics(
-            forecast_value=100500.0,
-            observed_value=100400.0,
-            thresholds=[101000.0],
-            operator='<'
-        )
-        # Both are below threshold
-        assert result[101000.0]['outcome'] == 'hit'
-        assert result[101000.0]['forecast_exceeds'] is True
-        assert result[101000.0]['observed_exceeds'] is True
+    def test_result_arrays_and_lookup(self):
+        """Results expose per-threshold arrays and look up only the given thresholds."""
+        result = calculate_threshold_metrics(101200.0, 101300.0, [102000.0, 100000.0, 101250.0])
+
+        assert result.outcomes.tolist() == ['correct_negative', 'hit', 'miss']
+        assert result.forecast_exceeds.tolist() == [False, True, False]
+        assert list(result) == [102000.0, 100000.0, 101250.0]
+        assert result[np.float64(101250.0)]['outcome'] == 'miss'
+        with pytest.raises(KeyError):
+            result[101000.0]
+
+    @pytest.mark.parametrize("operator,op_code", [('>', 0), ('>=', 1), ('<', 2), ('<=', 3)])
+    def test_kernel_matches_outcomes(self, operator, op_code):
+        """Threshold kernel codes should decode to the same outcomes for every operator."""
+        thresholds = np.array([100.0, 101.0, 102.0, 103.0])
+
+        codes = _threshold_kernel(101.0, 102.0, thresholds, op_code)
+        result = calculate_threshold_metrics(101.0, 102.0, thresholds, operator)
+
+        names = ['correct_negative', 'miss', 'false_alarm', 'hit']
+        assert [names[code] for code in codes] == [result[t]['outcome'] for t in thresholds]
+
+    def test_batch_matches_per_pair(self):
+        """Batch outcomes and counts should agree with per-pair results."""
+        forecasts = [12.0, 10.0, 15.0, 5.0, 13.0]
+        observed = [14.0, 13.5, 9.0, 4.0, 12.9]
+        thresholds = [12.86, 17.49]
+
+        outcomes = calculate_threshold_outcomes(forecasts, observed, thresholds)
+
+        for i, (fc, obs) in enumerate(zip(forecasts, observed)):
+            result = calculate_threshold_metrics(fc, obs, thresholds)
+            for k, threshold in enumerate(thresholds):
+                assert outcomes['forecast_exceeds'][i, k] == result[threshold]['forecast_exceeds']
+                assert outcomes['observed_exceeds'][i, k] == result[threshold]['observed_exceeds']
+
+        assert outcomes['hits'].tolist() == [1, 0]
+        assert outcomes['misses'].tolist() == [2, 0]
+        assert outcomes['false_alarms'].tolist() == [1, 0]
+        assert outcomes['correct_negatives'].tolist() == [1, 5]
+
+    @pytest.mark.parametrize("operator", ['>', '>=', '<', '<='])
+    def test_sorted_counts_match_unsorted(self, operator):
+        """Masks and counts from the sorted-threshold fast path should match the unsorted path."""
+        rng = np.random.default_rng(7)
+        forecasts = rng.integers(0, 10, 200).astype(float)
+        observed = rng.integers(0, 10, 200).astype(float)
+        thresholds = np.array([2.0, 4.0, 4.0, 5.0, 8.0])
+        order = np.array([3, 0, 4, 1, 2])
+
+        sorted_outcomes = calculate_threshold_outcomes(forecasts, observed, thresholds, operator)
+        unsorted_outcomes = calculate_threshold_outcomes(forecasts, observed, thresholds[order], operator)
+
+        for key in ('forecast_exceeds', 'observed_exceeds'):
+            assert np.array_equal(sorted_outcomes[key][:, order], unsorted_outcomes[key])
+        assert np.array_equal(sorted_outcomes['counts'][order], unsorted_outcomes['counts'])
 
 
 class TestDecisionScores:
@@ -294,6 +400,22 @@ class TestDecisionScores:
         # When no events occurred, hit_rate is 0 (per implementation)
         assert scores['hit_rate'] == 0.0
 
+    def test_batch_matches_scalar(self):
+        """Batch scores should match scoring each table separately."""
+        tables = [(10, 0, 0, 5), (0, 10, 0, 5), (7, 2, 1, 10), (0, 0, 5, 10), (0, 0, 0, 0)]
+
+        batch = calculate_decision_scores_batch(*zip(*tables))
+
+        for i, (hits, misses, false_alarms, correct_negatives) in enumerate(tables):
+            scores = calculate_decision_scores({
+                'hits': hits,
+                'misses': misses,
+                'false_alarms': false_alarms,
+                'correct_negatives': correct_negatives
+            })
+            for key, value in scores.items():
+                assert batch[key][i] == pytest.approx(value)
+
     def test_operational_acceptable_performance(self):
         """Test metrics for operationally acceptable performance.
 